@@ -19,20 +19,29 @@ Example:
     'EVA automates the process of verifying a patient's eligibility...'
 """
 
+import contextlib
+import hashlib
 import os
 import sys
+import queue
+import threading
+import time
 import warnings
 import random
+import zlib
 import numpy as np
-from typing import Optional, Tuple
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import List, Optional, Tuple
 from sentence_transformers import SentenceTransformer
 
 # Import data structures containing predefined Q&A and generic responses
 from data import (
-    QUESTIONS, ANSWERS, FACET_MAP,
-    GREETING_RESPONSES, HELP_RESPONSES, FAREWELL_RESPONSES,
-    GRATITUDE_RESPONSES, UNKNOWN_RESPONSES, ACKNOWLEDGMENT_RESPONSES,
-    CONFUSION_RESPONSES, INTENT_KEYWORDS
+    QUESTIONS, QUESTIONS_LOWER, FACET_MAP,
+    ANSWERS_POOL, QUESTION_ANSWER_IDX, FACET_KEYS, FACET_ANSWER_IDX,
+    RESPONSES, CATEGORY_SLICES, INTENT_KEYWORDS
 )
 
 # ============================================================================
@@ -56,8 +65,93 @@ logging.getLogger("huggingface_hub").setLevel(logging.ERROR)
 
 # Configuration constants
 SIMILARITY_THRESHOLD = 0.55  # Minimum cosine similarity for semantic matches
+EARLY_EXIT_SCORE = 0.95  # "Obvious match" - stop scanning scores past this
 DEFAULT_MODEL = "all-MiniLM-L6-v2"  # Lightweight embedding model (~80MB)
 
+# Embedding backend selection:
+#   "onnx"      - INT8-quantized ONNX Runtime backend (much faster CPU
+#                 inference, uses VNNI int8 instructions on modern x86)
+#   "torch"     - default PyTorch backend
+#   "model2vec" - Model2Vec static embeddings (token lookup + mean; no
+#                 transformer forward at all - fastest, slightly weaker
+#                 matching, score distribution differs from MiniLM)
+# Each path requires its optional packages (`optimum`/`onnxruntime`,
+# `model2vec`); if anything is missing we silently fall back down the
+# list to the PyTorch backend.
+EMBED_BACKEND = os.getenv("EMBED_BACKEND", "onnx")
+
+# Model2Vec model for the "model2vec" backend - a hub id or local path
+MODEL2VEC_MODEL = os.getenv("MODEL2VEC_MODEL", "minishlab/potion-base-8M")
+
+# Where the one-time INT8 ONNX export is cached between runs
+ONNX_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "thoughtful", "onnx-int8"
+)
+
+# Where the pre-computed predefined-question embedding bank is cached
+# between runs (QUESTIONS is static, so encoding it every startup is waste)
+EMBED_BANK_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "thoughtful"
+)
+
+# Quantize the predefined-embedding bank to int8 for similarity scoring.
+# Cuts bank memory/bandwidth 4x; the accuracy cost on a top-1 retrieval
+# over a small question bank is negligible. Set EMBED_INT8=0 to disable.
+INT8_SCORING = os.getenv("EMBED_INT8", "1") == "1"
+
+# Micro-batch concurrent query encodes into single forward passes.
+# Only useful when the agent serves multiple threads (e.g. behind a web
+# framework); adds up to MICRO_BATCH_WAIT_MS latency per query, so it's
+# off by default for the single-user CLI. Set EMBED_MICROBATCH=1 to enable.
+MICRO_BATCHING = os.getenv("EMBED_MICROBATCH", "0") == "1"
+MICRO_BATCH_SIZE = 32       # Encoder utilization saturates around this size
+MICRO_BATCH_WAIT_MS = 5.0   # Max time to wait for the batch to fill
+
+# Max query embeddings kept in the per-agent LRU cache. At ~384 float32s
+# per entry, 1024 entries is well under 2MB.
+EMBED_CACHE_SIZE = 1024
+
+# Banks with fewer rows than this score via np.einsum instead of BLAS
+# matvec - below this size BLAS dispatch overhead exceeds the math
+_SMALL_BANK_ROWS = 64
+
+# Optional Matryoshka-style truncation: keep only the first N embedding
+# dims (then re-normalize), shrinking the bank and every similarity dot
+# product proportionally. Off by default (0 = full dimensionality) -
+# MiniLM is not MRL-trained, so truncation costs more recall here than
+# it would on a Matryoshka model, and the bank is tiny anyway.
+EMBED_TRUNCATE_DIM = int(os.getenv("EMBED_TRUNCATE_DIM", "0"))
+
+# Compile the transformer backbone with torch.compile (PyTorch 2.x)
+# when using the torch backend. Fuses MatMul/GeLU/LayerNorm kernels for
+# the MiniLM forward; first-query warmup pays the compile cost, so this
+# is off by default for short-lived CLI sessions. Set EMBED_COMPILE=1.
+EMBED_COMPILE = os.getenv("EMBED_COMPILE", "0") == "1"
+
+# Trigram-bloom prefilter for semantic search. Queries whose character
+# trigrams overlap (almost) nowhere with the question bank can't clear
+# SIMILARITY_THRESHOLD, so skipping the encoder - and on the first query,
+# the model load itself - saves a full forward pass on clearly off-topic
+# input. Off by default: aggressive paraphrases share few trigrams too,
+# so enable (EMBED_PREFILTER=1) only where the traffic mix warrants it.
+EMBED_PREFILTER = os.getenv("EMBED_PREFILTER", "0") == "1"
+_BLOOM_BITS = 1024          # 16 uint64 words per bloom row
+_PREFILTER_MIN_OVERLAP = 2  # Bank rows must share at least this many bits
+
+# Warm the embedding model on a background thread at construction time.
+# Overlaps model load with whatever else the host app does at startup;
+# the first semantic query then finds the model ready instead of paying
+# the load itself. Off by default - the lazy path keeps pure-intent
+# sessions from ever loading the model. Set EMBED_PRELOAD=1 to enable.
+EMBED_PRELOAD = os.getenv("EMBED_PRELOAD", "0") == "1"
+
+# Latency budget for the OpenAI fallback. The SDK call can block for
+# hundreds of ms (or far longer under API slowness); if it hasn't
+# finished within the budget we serve a generic fallback instead so one
+# slow round-trip can't stall the whole agent. Set OPENAI_TIMEOUT_S=0
+# to wait indefinitely.
+OPENAI_TIMEOUT_S = float(os.getenv("OPENAI_TIMEOUT_S", "1.5"))
+
 # Optional OpenAI integration - gracefully handles if not installed
 try:
     from openai import OpenAI
@@ -67,6 +161,462 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# Optional SimSIMD integration - SIMD-accelerated cosine similarity.
+# For small question banks the np.dot BLAS dispatch overhead dominates the
+# actual math; SimSIMD's fused cosine kernel avoids it entirely.
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+# Optional pyahocorasick integration - compiles all intent keywords into a
+# single DFA so intent detection is one linear scan of the query instead of
+# dozens of separate Python substring/set-membership checks.
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional Model2Vec integration - static sentence embeddings for the
+# "model2vec" backend. No transformer forward pass at encode time.
+try:
+    from model2vec import StaticModel
+    MODEL2VEC_AVAILABLE = True
+except ImportError:
+    MODEL2VEC_AVAILABLE = False
+
+
+class Intent(IntEnum):
+    """Intent categories, usable as direct indexes into _RESPONSE_TABLE."""
+    GREETING = 0
+    HELP = 1
+    FAREWELL = 2
+    GRATITUDE = 3
+    ACKNOWLEDGMENT = 4
+    CONFUSION = 5
+    UNKNOWN = 6
+
+
+# Generic response ranges and source labels, indexed by Intent. Each row
+# carries the category's range into the flattened RESPONSES tuple, so the
+# picker subscripts one shared contiguous store instead of chasing seven
+# separate tuple objects, and the fixed int indexing avoids string-keyed
+# dict lookups on the response hot path.
+_RESPONSE_TABLE = (
+    (CATEGORY_SLICES["greeting"], "generic-greeting"),
+    (CATEGORY_SLICES["help"], "generic-help"),
+    (CATEGORY_SLICES["farewell"], "generic-farewell"),
+    (CATEGORY_SLICES["gratitude"], "generic-gratitude"),
+    (CATEGORY_SLICES["acknowledgment"], "generic-ack"),
+    (CATEGORY_SLICES["confusion"], "generic-confusion"),
+    (CATEGORY_SLICES["unknown"], "generic-unknown"),
+)
+
+# Maps the string intents produced by _detect_intent to table indexes
+_INTENT_INDEX = {
+    "greeting": Intent.GREETING,
+    "help": Intent.HELP,
+    "farewell": Intent.FAREWELL,
+    "gratitude": Intent.GRATITUDE,
+    "acknowledgment": Intent.ACKNOWLEDGMENT,
+    "confusion": Intent.CONFUSION,
+    "unknown": Intent.UNKNOWN,
+}
+
+
+# Intent keyword table for the Aho-Corasick automaton.
+# Each entry is (keyword, priority, intent, whole_word):
+#   - priority mirrors the check order in _detect_intent (lower wins)
+#   - whole_word=True requires whitespace boundaries around the hit, so
+#     the match corresponds to a whole split() token (e.g. "sup" doesn't
+#     fire inside "support"); False matches as a substring, matching the
+#     original per-category semantics
+_INTENT_PATTERNS = tuple(
+    [(kw, 0, "help", False) for kw in (
+        "help", "what can you do", "what do you do", "capabilities",
+        "what are you", "who are you", "features", "functions", "assist")] +
+    [(kw, 1, "greeting", True) for kw in (
+        "hi", "hello", "hey", "greetings", "howdy", "hiya", "yo", "sup")] +
+    [(kw, 1, "greeting", False) for kw in ("morning", "afternoon", "evening")] +
+    [(kw, 2, "farewell", True) for kw in (
+        "bye", "goodbye", "cya", "later", "exit", "quit")] +
+    [("see you", 2, "farewell", False)] +
+    [(kw, 3, "gratitude", True) for kw in (
+        "thanks", "thank", "thx", "ty", "appreciate", "grateful", "cheers")] +
+    [(kw, 4, "acknowledgment", True) for kw in (
+        "ok", "okay", "cool", "great", "good", "nice", "perfect", "sure",
+        "alright")] +
+    [(kw, 5, "confusion", True) for kw in ("what", "huh")] +
+    [(kw, 5, "confusion", False) for kw in (
+        "don't understand", "dont understand")]
+)
+
+
+# Vocabulary of every word appearing in any intent keyword - used by the
+# fast pre-check in respond() to decide whether a short query can be
+# classified without running the embedding model at all
+_INTENT_VOCAB = frozenset(
+    word
+    for keyword, _, _, _ in _INTENT_PATTERNS
+    for word in keyword.split()
+)
+
+# Queries longer than this never take the fast intent path; longer inputs
+# may carry a real question ("hi, what is EVA") worth a semantic match
+_PRECHECK_MAX_TOKENS = 3
+
+
+def _keywords_for(intent: str, whole_word: bool):
+    """Pull keywords of one intent/match-kind out of _INTENT_PATTERNS."""
+    return tuple(
+        keyword
+        for keyword, _, kw_intent, kw_whole in _INTENT_PATTERNS
+        if kw_intent == intent and kw_whole == whole_word
+    )
+
+
+# Keyword constants for the no-automaton fallback in _detect_intent.
+# Hoisted to module level (no per-call list building) and derived from
+# the same pattern table the automaton compiles, so the two detection
+# paths cannot drift apart. Whole-word keywords become frozensets for
+# O(1) token intersections; substring keywords stay ordered tuples.
+_HELP_SUBSTRINGS = _keywords_for("help", False)
+_GREETING_WORDS = frozenset(_keywords_for("greeting", True))
+_TIME_GREETING_SUBSTRINGS = _keywords_for("greeting", False)
+_FAREWELL_WORDS = frozenset(_keywords_for("farewell", True))
+_FAREWELL_SUBSTRINGS = _keywords_for("farewell", False)
+_GRATITUDE_WORDS = frozenset(_keywords_for("gratitude", True))
+_ACK_WORDS = frozenset(_keywords_for("acknowledgment", True))
+_CONFUSION_WORDS = frozenset(_keywords_for("confusion", True))
+_CONFUSION_SUBSTRINGS = _keywords_for("confusion", False)
+
+
+def _build_first_word_intent() -> dict:
+    """
+    Exact-match intent lookup for single-token queries.
+
+    Maps every single-word intent keyword to its intent, built in
+    priority order (setdefault keeps the higher-priority claim on
+    contested words). "hi", "ok", "thanks" and friends then classify
+    with one dict probe; a miss falls through to the full scan, so this
+    is purely a fast path.
+    """
+    lookup = {}
+    for keyword, _, intent, _ in _INTENT_PATTERNS:
+        if " " not in keyword:
+            lookup.setdefault(keyword, intent)
+    return lookup
+
+
+_FIRST_WORD_INTENT = _build_first_word_intent()
+
+
+def _build_openai_http_client():
+    """
+    Build a pooled httpx client for the OpenAI SDK.
+
+    Keep-alive connections let repeated LLM fallbacks reuse the TCP+TLS
+    session instead of re-handshaking per call; HTTP/2 multiplexing is
+    enabled when the optional h2 package is installed. Returns None -
+    meaning the SDK's default client - if anything is unavailable.
+    """
+    try:
+        import httpx
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+        timeout = httpx.Timeout(30.0)
+        try:
+            return httpx.Client(http2=True, limits=limits, timeout=timeout)
+        except ImportError:
+            # h2 not installed - HTTP/1.1 keep-alive still pools fine
+            return httpx.Client(limits=limits, timeout=timeout)
+    except Exception:
+        return None
+
+
+def _tune_torch() -> None:
+    """
+    Apply one-time global torch settings for CPU inference.
+
+    Caps intra-op threads at half the cores - thread oversubscription
+    hurts small-batch latency far more than it helps throughput here -
+    pins interop parallelism to one thread (we never run concurrent
+    graphs), and disables autograd globally, since this process only
+    ever runs inference. TORCH_NUM_THREADS overrides the intra-op count
+    for deployments that share cores with a web-framework worker pool.
+    Called at model-load time rather than import time so sessions that
+    never reach semantic search don't pay the torch import at all.
+    """
+    try:
+        import torch
+        default_threads = max(1, (os.cpu_count() or 2) // 2)
+        torch.set_num_threads(
+            int(os.getenv("TORCH_NUM_THREADS", default_threads))
+        )
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # Already set once for this process
+        torch.set_grad_enabled(False)
+    except Exception:
+        pass  # torch missing (pure-ONNX install) - nothing to tune
+
+
+def _truncate_normalized(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Truncate embeddings to EMBED_TRUNCATE_DIM dims and re-normalize.
+
+    Applied identically to the question bank and to query embeddings so
+    truncated dot products remain true cosines. A no-op when truncation
+    is disabled or the embeddings are already small enough.
+    """
+    if EMBED_TRUNCATE_DIM <= 0 or embeddings.shape[-1] <= EMBED_TRUNCATE_DIM:
+        return embeddings
+
+    truncated = np.ascontiguousarray(
+        embeddings[..., :EMBED_TRUNCATE_DIM], dtype=np.float32
+    )
+    norms = np.linalg.norm(truncated, axis=-1, keepdims=True)
+    return truncated / np.maximum(norms, 1e-12)
+
+
+# Per-byte popcount lookup table for the NumPy 1.x fallback below
+_POPCOUNT_TABLE = np.array(
+    [bin(i).count("1") for i in range(256)], dtype=np.uint8
+)
+
+
+def _popcount_u64_fallback(masks: np.ndarray) -> np.ndarray:
+    """
+    Element-wise popcount for uint64 arrays on NumPy < 2.0.
+
+    Views each uint64 as 8 bytes and sums per-byte popcounts from a
+    256-entry lookup table. Slower than the native ufunc but keeps the
+    vectorized facet-overlap path working on older NumPy installs.
+    """
+    byte_view = np.ascontiguousarray(masks).view(np.uint8)
+    return _POPCOUNT_TABLE[byte_view].reshape(masks.shape + (8,)).sum(axis=-1)
+
+
+# np.bitwise_count is NumPy >= 2.0 only; requirements.txt still permits
+# 1.x, so fall back to the table-based popcount there
+_popcount_u64 = getattr(np, "bitwise_count", _popcount_u64_fallback)
+
+
+def _trigram_bloom(text: str) -> np.ndarray:
+    """
+    Hash the character trigrams of text into a 1024-bit bloom row.
+
+    Each trigram sets one bit (crc32 mod _BLOOM_BITS - deterministic
+    across processes, unlike the salted builtin hash). Two strings with
+    no common trigrams share bits only by collision, so a near-empty
+    intersection is strong evidence that no question in the bank can
+    come close to the query.
+    """
+    row = np.zeros(_BLOOM_BITS // 64, dtype=np.uint64)
+    data = text.encode("utf-8", errors="ignore")
+    for i in range(len(data) - 2):
+        bit = zlib.crc32(data[i:i + 3]) & (_BLOOM_BITS - 1)
+        row[bit >> 6] |= np.uint64(1) << np.uint64(bit & 63)
+    return row
+
+
+# Flat, immutable snapshot of the facet keys with their answer-pool
+# indexes, for the no-automaton fallback scan. Iterating a tuple of
+# pairs skips the per-item dict machinery and gives the scan a compact,
+# cache-friendly layout; hits resolve through ANSWERS_POOL so the
+# handful of shared answer strings is stored once. Entries stay in
+# FACET_MAP insertion order: the substring stage's first-match tie-break
+# is observable behavior (and pinned by tests), so a length-sorted
+# layout would change results for queries containing several facets.
+FACET_ENTRIES = tuple(zip(FACET_KEYS, FACET_ANSWER_IDX))
+
+
+def _build_facet_automaton():
+    """
+    Compile all facet phrases into an Aho-Corasick automaton.
+
+    Each facet maps to (position, answer_idx) where position is its
+    FACET_MAP insertion index - so ties between overlapping hits resolve
+    the same way as the original first-match dict iteration - and
+    answer_idx resolves through ANSWERS_POOL.
+
+    Returns:
+        Finalized ahocorasick.Automaton, or None if the optional
+        pyahocorasick package is not installed.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for position, (facet, answer_idx) in enumerate(FACET_ENTRIES):
+        automaton.add_word(facet, (position, answer_idx))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_intent_automaton():
+    """
+    Compile the intent keyword table into an Aho-Corasick automaton.
+
+    Returns:
+        Finalized ahocorasick.Automaton, or None if the optional
+        pyahocorasick package is not installed.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword, priority, intent, whole_word in _INTENT_PATTERNS:
+        automaton.add_word(keyword, (priority, intent, whole_word, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _normalize_query(query: str) -> str:
+    """
+    Canonical form of a query for caching and equivalence checks.
+
+    Strips surrounding whitespace and lowercases - the same
+    normalization QueryCtx applies - so queries differing only in case
+    or padding share one embedding-cache entry.
+    """
+    return query.strip().lower()
+
+
+@dataclass(slots=True)
+class QueryCtx:
+    """
+    Preprocessed views of a user query, computed once per request.
+
+    The matching helpers all need some combination of the lowercased
+    query, its tokens, and a token set; building them here means each
+    string is lowered and split exactly once per request instead of once
+    per helper.
+
+    Attributes:
+        raw: The stripped original query (cased, for the encoder)
+        lower: Lowercased form of raw
+        tokens: Whitespace tokens of lower
+        tokens_set: Frozenset of tokens for O(1) membership checks
+    """
+    raw: str
+    lower: str
+    tokens: List[str]
+    tokens_set: frozenset
+
+    @classmethod
+    def from_query(cls, query: str) -> "QueryCtx":
+        """Build a context from raw user input (strips surrounding space)."""
+        raw = query.strip()
+        lower = raw.lower()
+        tokens = lower.split()
+        return cls(raw=raw, lower=lower, tokens=tokens,
+                   tokens_set=frozenset(tokens))
+
+
+class _StaticModelAdapter:
+    """
+    Minimal encode() adapter over a Model2Vec StaticModel.
+
+    Exposes the slice of the SentenceTransformer interface the agent
+    actually uses, so the rest of the pipeline stays backend-agnostic.
+    Static embeddings are a token lookup plus mean - no attention, no
+    transformer forward - trading a little matching quality for
+    microsecond-scale encodes.
+    """
+
+    def __init__(self, static_model):
+        self._model = static_model
+
+    def encode(self, sentences, **_kwargs):
+        """Encode sentences to L2-normalized float32 embeddings."""
+        embeddings = np.asarray(self._model.encode(sentences), dtype=np.float32)
+        if embeddings.ndim == 1:
+            embeddings = embeddings.reshape(1, -1)
+
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
+
+
+class _QueryBatcher:
+    """
+    Coalesce concurrent encode requests into single batched forward passes.
+
+    A single-query encode under-utilizes the encoder; batches amortize the
+    fixed tokenizer + forward-pass overhead across all waiting queries.
+    A daemon worker thread drains a queue, collecting up to `max_batch`
+    queries or waiting at most `max_wait_ms` after the first arrival, then
+    runs one batched encode and hands each caller its row.
+
+    Callers block on a per-request Event, so the public `encode` keeps a
+    simple synchronous signature.
+    """
+
+    def __init__(self, encode_fn, max_batch: int = MICRO_BATCH_SIZE,
+                 max_wait_ms: float = MICRO_BATCH_WAIT_MS):
+        """
+        Args:
+            encode_fn: Callable taking a list of strings and returning an
+                array of embeddings (one row per input)
+            max_batch: Maximum queries to coalesce into one forward pass
+            max_wait_ms: Max milliseconds to wait for the batch to fill
+        """
+        self._encode_fn = encode_fn
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._run, daemon=True, name="embed-batcher"
+        )
+        self._worker.start()
+
+    def encode(self, text: str) -> np.ndarray:
+        """
+        Encode a single query, transparently batched with concurrent calls.
+
+        Args:
+            text: The query string to encode
+
+        Returns:
+            1-D embedding array for the query
+        """
+        done = threading.Event()
+        slot = {}
+        self._queue.put((text, done, slot))
+        done.wait()
+        if "error" in slot:
+            raise slot["error"]
+        return slot["result"]
+
+    def _run(self) -> None:
+        """Worker loop: collect a batch, encode once, fan out results."""
+        while True:
+            batch = [self._queue.get()]
+
+            # Give concurrent callers a short window to join the batch
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                embeddings = self._encode_fn([item[0] for item in batch])
+                for (_, done, slot), embedding in zip(batch, embeddings):
+                    slot["result"] = embedding
+                    done.set()
+            except Exception as exc:
+                # Propagate the failure to every waiting caller
+                for _, done, slot in batch:
+                    slot["error"] = exc
+                    done.set()
+
 
 class ThoughtfulAIAgent:
     """
@@ -107,37 +657,109 @@ class ThoughtfulAIAgent:
     def __init__(self):
         """
         Initialize the agent.
-        
+
         This performs several setup steps:
-        1. Initializes the sentence transformer model (silent)
-        2. Pre-computes embeddings for all predefined questions
+        1. Sets up response rotation counters for variety
+        2. Compiles the intent/facet automatons and facet bitmasks
         3. Attempts to initialize OpenAI client (optional, silent on failure)
-        4. Sets up response rotation counters for variety
+
+        The sentence transformer model itself is NOT loaded here - it is
+        loaded lazily by _ensure_model on the first query that needs
+        semantic search, keeping construction near-instant.
         """
         self.predefined_embeddings = None
         self.openai_client = None
         self.openai_enabled = False
         
-        # Initialize counters for response rotation (ensures variety)
-        self._response_counters = {
-            "greeting": 0,
-            "help": 0,
-            "farewell": 0,
-            "gratitude": 0,
-            "unknown": 0,
-            "acknowledgment": 0,
-            "confusion": 0,
-        }
-        
-        # Load the embedding model with suppressed output
-        self.embedding_model = self._load_model_silently()
-        
-        # Pre-compute embeddings for all predefined questions
-        # This is done once at initialization for fast query-time matching
-        self._compute_embeddings()
+        # Initialize counters for response rotation (ensures variety).
+        # A flat unsigned-int array indexed by Intent - no dict hashing
+        # when a counter is bumped.
+        self._response_counters = array('I', [0] * len(Intent))
         
+        # Compile the intent keywords into a single DFA (None if the
+        # optional pyahocorasick package is unavailable)
+        self._intent_automaton = _build_intent_automaton()
+
+        # Compile facet phrases into a DFA for the substring matcher
+        self._facet_automaton = _build_facet_automaton()
+
+        # Precompute facet word bitmasks for the word-overlap matcher
+        self._init_facet_masks()
+
+        # Per-question trigram blooms for the opt-in semantic prefilter.
+        # Cheap to build (a few hundred trigrams total) and only built
+        # when the prefilter is actually enabled.
+        self._question_blooms = (
+            np.stack([_trigram_bloom(q) for q in QUESTIONS_LOWER])
+            if EMBED_PREFILTER else None
+        )
+
+        # The embedding model is loaded lazily on the first semantic query:
+        # short sessions ("hi" / "bye") are handled entirely by intent
+        # detection and never pay the multi-second model load.
+        self.embedding_model = None
+        self._query_batcher = None
+        self._model_lock = threading.Lock()
+
+        # Identity of the backend that actually loaded (set by
+        # _load_backend); part of the bank-cache key, since each backend
+        # encodes into its own embedding space
+        self._backend_key = "torch"
+
+        # LRU cache of query embeddings keyed by normalized query text -
+        # repeated questions skip the encoder forward pass entirely
+        self._embed_cache = OrderedDict()
+
+        # Daemon worker thread for budgeted OpenAI calls - created on
+        # first use. Daemon so a hung SDK call that already timed out for
+        # the user can't stall interpreter exit.
+        self._openai_worker = None
+        self._openai_queue = None
+
         # Attempt to initialize OpenAI (optional, doesn't affect core functionality)
         self._init_openai_silently()
+
+        # Optionally warm the model in the background so startup work in
+        # the host app overlaps the load. _ensure_model is lock-guarded,
+        # so a query arriving mid-load simply waits for it to finish.
+        if EMBED_PRELOAD:
+            threading.Thread(target=self._ensure_model, daemon=True).start()
+
+    def _ensure_model(self) -> None:
+        """
+        Load the embedding model and question bank on first use.
+
+        Deferred from __init__ so that agent construction is near-instant
+        and sessions that never need semantic search (trivial greetings,
+        farewells) never load the model at all. Thread-safe: concurrent
+        first queries serialize on a lock and only one performs the load.
+        """
+        if self.embedding_model is not None:
+            return
+
+        with self._model_lock:
+            if self.embedding_model is not None:
+                return
+
+            # Load the embedding model with suppressed output
+            model = self._load_model_silently()
+
+            # Set up the direct tokenize-and-forward encode path for queries
+            self.embedding_model = model
+            self._init_fast_encoder()
+
+            # Optional micro-batching of concurrent encode calls (for serving
+            # the agent from multiple threads; off by default for the CLI)
+            if MICRO_BATCHING:
+                self._query_batcher = _QueryBatcher(
+                    lambda texts: self.embedding_model.encode(
+                        texts, show_progress_bar=False, normalize_embeddings=True
+                    )
+                )
+
+            # Pre-compute embeddings for all predefined questions
+            # This is done once so query-time matching stays fast
+            self._compute_embeddings()
     
     def _load_model_silently(self) -> SentenceTransformer:
         """
@@ -149,37 +771,274 @@ class ThoughtfulAIAgent:
         Returns:
             Loaded SentenceTransformer model
         """
-        from io import StringIO
-        
-        # Capture and discard stdout/stderr during model loading
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        sys.stdout = StringIO()
-        sys.stderr = StringIO()
-        
-        try:
-            model = SentenceTransformer(DEFAULT_MODEL)
-        finally:
-            # Restore output streams
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
-        
-        return model
+        # Discard loader chatter at the OS level rather than buffering it
+        # in an in-memory StringIO that grows with whatever gets printed
+        with open(os.devnull, "w") as devnull, \
+                contextlib.redirect_stdout(devnull), \
+                contextlib.redirect_stderr(devnull):
+            return self._load_backend()
+
+    def _load_backend(self) -> SentenceTransformer:
+        """
+        Load the embedding model using the configured backend.
+
+        When EMBED_BACKEND is "onnx", this loads an INT8 dynamically-quantized
+        ONNX export of the model. The export is produced once and cached in
+        ONNX_CACHE_DIR, so subsequent startups just load the quantized graph.
+        Quantization only affects the encoder - predefined embeddings stay FP32.
+
+        Any failure (missing optimum/onnxruntime, export error, etc.) falls
+        back to the default PyTorch backend so core functionality is never
+        affected.
+
+        Returns:
+            Loaded SentenceTransformer model (ONNX-quantized or PyTorch)
+        """
+        if EMBED_BACKEND == "model2vec" and MODEL2VEC_AVAILABLE:
+            try:
+                model = _StaticModelAdapter(
+                    StaticModel.from_pretrained(MODEL2VEC_MODEL)
+                )
+                self._backend_key = f"model2vec:{MODEL2VEC_MODEL}"
+                return model
+            except Exception:
+                # Fall through to the transformer backends
+                pass
+
+        _tune_torch()
+
+        if EMBED_BACKEND == "onnx":
+            try:
+                model = self._load_onnx_quantized()
+                self._backend_key = "onnx"
+                return model
+            except Exception:
+                # Fall through to the standard PyTorch backend
+                pass
+
+        self._backend_key = "torch"
+        return SentenceTransformer(DEFAULT_MODEL)
+
+    def _load_onnx_quantized(self) -> SentenceTransformer:
+        """
+        Load (exporting and caching on first run) the INT8 ONNX model.
+
+        The first run exports a dynamically-quantized ONNX model into
+        ONNX_CACHE_DIR using the "avx512_vnni" quantization config, which
+        activates int8 dot-product instructions on supporting CPUs. Later
+        runs load the cached export directly.
+
+        Returns:
+            SentenceTransformer backed by the quantized ONNX model
+
+        Raises:
+            Exception: If the ONNX backend or quantization tooling is
+                unavailable; the caller falls back to PyTorch.
+        """
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        quantized_file = os.path.join(
+            ONNX_CACHE_DIR, "onnx", "model_qint8_avx512_vnni.onnx"
+        )
+
+        if not os.path.exists(quantized_file):
+            # One-time export: load with the ONNX backend, quantize, cache
+            model = SentenceTransformer(DEFAULT_MODEL, backend="onnx")
+            os.makedirs(ONNX_CACHE_DIR, exist_ok=True)
+            export_dynamic_quantized_onnx_model(
+                model, "avx512_vnni", ONNX_CACHE_DIR
+            )
+            model.save(ONNX_CACHE_DIR)
+
+        return SentenceTransformer(
+            ONNX_CACHE_DIR,
+            backend="onnx",
+            model_kwargs={"file_name": "onnx/model_qint8_avx512_vnni.onnx"},
+        )
     
+    def _init_fast_encoder(self) -> None:
+        """
+        Cache the tokenizer and transformer for direct query encoding.
+
+        SentenceTransformer.encode re-enters Python-level preprocessing and
+        builds per-call feature dicts even for a batch of one. For the
+        PyTorch backend we can stash the tokenizer and the underlying
+        transformer module once and call them directly per query, skipping
+        that overhead. Non-torch backends (e.g. ONNX) keep using encode.
+
+        Sets self._tokenizer / self._transformer, or leaves them as None
+        when the fast path does not apply.
+        """
+        self._tokenizer = None
+        self._transformer = None
+
+        try:
+            import torch
+            transformer = self.embedding_model[0].auto_model
+            if isinstance(transformer, torch.nn.Module):
+                if EMBED_COMPILE:
+                    try:
+                        transformer = torch.compile(
+                            transformer, mode="reduce-overhead", dynamic=True
+                        )
+                        self.embedding_model[0].auto_model = transformer
+                    except Exception:
+                        pass  # torch.compile unsupported - eager works fine
+                self._torch = torch
+                self._tokenizer = self.embedding_model.tokenizer
+                self._transformer = transformer.eval()
+        except Exception:
+            # Fast path unavailable - encode() still works fine
+            self._tokenizer = None
+            self._transformer = None
+
+    def _encode_query(self, query: str) -> np.ndarray:
+        """
+        Encode a single query, with an LRU cache on normalized query text.
+
+        Chat traffic repeats queries ("hi", "what is EVA?") often; a cache
+        hit skips the encoder forward pass - the most expensive operation
+        on the hot path - entirely. The cache sits on the embedding rather
+        than the full response, so answer-data changes still propagate.
+
+        Args:
+            query: The user's input query
+
+        Returns:
+            Embedding array of shape (1, dim)
+        """
+        key = _normalize_query(query)
+        cached = self._embed_cache.get(key)
+        if cached is not None:
+            self._embed_cache.move_to_end(key)  # Mark as most recent
+            return cached
+
+        embedding = _truncate_normalized(self._encode_query_uncached(query))
+
+        self._embed_cache[key] = embedding
+        if len(self._embed_cache) > EMBED_CACHE_SIZE:
+            self._embed_cache.popitem(last=False)  # Evict least recent
+
+        return embedding
+
+    def _encode_query_uncached(self, query: str) -> np.ndarray:
+        """
+        Encode a single query, using the direct forward path when possible.
+
+        Tokenizes once, runs the transformer under torch.inference_mode,
+        then mean-pools and L2-normalizes manually - the same pipeline the
+        model applies, without sentence-transformers' per-call batching
+        machinery. Falls back to encode() if the fast path is unavailable
+        or fails.
+
+        Args:
+            query: The user's input query
+
+        Returns:
+            Embedding array of shape (1, dim)
+        """
+        if self._query_batcher is not None:
+            return self._query_batcher.encode(query).reshape(1, -1)
+
+        if self._transformer is None:
+            return self.embedding_model.encode(
+                [query], show_progress_bar=False, normalize_embeddings=True
+            )
+
+        try:
+            torch = self._torch
+            encoded = self._tokenizer(
+                [query],
+                return_tensors="pt",
+                truncation=True,
+                max_length=self.embedding_model.max_seq_length,
+            )
+            with torch.inference_mode():
+                output = self._transformer(**encoded)
+
+            # Mean pooling over non-padding tokens, then L2 normalization -
+            # mirrors the model's own pooling + normalize modules
+            token_embeddings = output[0]
+            mask = encoded["attention_mask"].unsqueeze(-1).to(token_embeddings.dtype)
+            embedding = (token_embeddings * mask).sum(1) / mask.sum(1).clamp(min=1e-9)
+            embedding = torch.nn.functional.normalize(embedding, p=2, dim=1)
+
+            return embedding.cpu().numpy()
+        except Exception:
+            return self.embedding_model.encode(
+                [query], show_progress_bar=False, normalize_embeddings=True
+            )
+
+    def _embedding_cache_path(self) -> str:
+        """
+        Cache file path for the predefined-question embedding bank.
+
+        The filename is keyed on a hash of the question texts plus the
+        model name and the backend that actually loaded, so editing
+        data.py, swapping models, or switching EMBED_BACKEND all
+        invalidate any previously cached bank. Keying on the backend
+        matters: Model2Vec banks have a different dimensionality than
+        MiniLM ones, and the quantized ONNX encoder emits slightly
+        different vectors than the PyTorch one.
+        """
+        digest = hashlib.sha1(
+            ("\x1f".join(QUESTIONS) + DEFAULT_MODEL
+             + f":{self._backend_key}:{EMBED_TRUNCATE_DIM}").encode("utf-8")
+        ).hexdigest()[:16]
+        return os.path.join(EMBED_BANK_CACHE_DIR, f"emb_{digest}.npy")
+
     def _compute_embeddings(self) -> None:
         """
-        Pre-compute embeddings for all predefined questions.
-        
+        Load or pre-compute embeddings for all predefined questions.
+
         This is an optimization that encodes all predefined questions once
         at startup. At query time, we only need to encode the user's query
         and compute cosine similarities.
-        
+
+        Because QUESTIONS is static, the encoded bank is also serialized
+        to a float16 .npy on first run and memory-mapped on subsequent
+        startups, so cold start skips the encode entirely.
+
         The embeddings are stored in self.predefined_embeddings.
         """
-        self.predefined_embeddings = self.embedding_model.encode(
-            QUESTIONS, 
-            show_progress_bar=False  # Suppress tqdm progress bar
+        cache_path = self._embedding_cache_path()
+        if os.path.exists(cache_path):
+            try:
+                self.predefined_embeddings = np.load(cache_path, mmap_mode="r")
+                if INT8_SCORING:
+                    self._quantize_embeddings()
+                print("✅ Agent ready!", file=sys.stderr)
+                return
+            except Exception:
+                pass  # Unreadable/corrupt cache - fall through and re-encode
+
+        embeddings = self.embedding_model.encode(
+            QUESTIONS,
+            batch_size=64,  # One pass over the whole bank, no re-batching
+            show_progress_bar=False,  # Suppress tqdm progress bar
+            convert_to_numpy=True,
+            normalize_embeddings=True,  # Dot products are true cosines
+        )
+        # Contiguous float32 layout so SIMD similarity kernels can consume
+        # the matrix directly without per-query copies
+        self.predefined_embeddings = np.ascontiguousarray(
+            _truncate_normalized(embeddings), dtype=np.float32
         )
+
+        if INT8_SCORING:
+            self._quantize_embeddings()
+
+        # Downcast the stored bank to float16: halves its memory footprint
+        # and cache pressure. Consumers either use the int8 copy or upcast
+        # to float32 on the fly; scores accumulate in FP32 either way.
+        self.predefined_embeddings = self.predefined_embeddings.astype(np.float16)
+
+        try:
+            os.makedirs(EMBED_BANK_CACHE_DIR, exist_ok=True)
+            np.save(cache_path, self.predefined_embeddings)
+        except Exception:
+            pass  # Cache dir not writable - we just re-encode next run
+
         print("✅ Agent ready!", file=sys.stderr)
     
     def _init_openai_silently(self) -> None:
@@ -202,48 +1061,222 @@ class ThoughtfulAIAgent:
         # Validate API key (not empty, not placeholder)
         if api_key and api_key.strip() and api_key != "your_openai_api_key_here":
             try:
-                self.openai_client = OpenAI(api_key=api_key)
+                self.openai_client = OpenAI(
+                    api_key=api_key,
+                    http_client=_build_openai_http_client(),
+                )
                 self.openai_enabled = True
             except Exception:
                 # Silently fail - generic responses work perfectly fine
                 pass
     
-    def _find_best_match(self, query: str) -> Tuple[Optional[str], float]:
+    def _find_best_match(self, query: str) -> Tuple[Optional[int], float]:
         """
         Find the best matching predefined question using cosine similarity.
-        
+
         This method encodes the user's query and compares it against all
         pre-computed question embeddings using cosine similarity.
-        
+
         Args:
             query: The user's input query
-            
+
         Returns:
-            Tuple of (matched_question, similarity_score)
-            - matched_question: The best matching predefined question, or None
+            Tuple of (matched_index, similarity_score)
+            - matched_index: Index of the best matching predefined
+              question (into QUESTIONS/QUESTION_ANSWER_IDX), or None
             - similarity_score: Cosine similarity (0.0 to 1.0)
-            
+
         Note:
             A match is only returned if similarity >= SIMILARITY_THRESHOLD
         """
+        # Opt-in trigram prefilter: if the query shares essentially no
+        # character trigrams with any bank question, no embedding can
+        # clear SIMILARITY_THRESHOLD - skip the encoder (and, on a cold
+        # agent, the model load itself) and report no match.
+        if self._question_blooms is not None and self._prefilter_rejects(query):
+            return None, 0.0
+
+        # Load the model and question bank on first use
+        self._ensure_model()
+
         # Encode the user's query (this is the expensive operation)
-        query_embedding = self.embedding_model.encode([query])
-        
+        query_embedding = self._encode_query(query)
+
         # Compute cosine similarities with all predefined questions
-        # np.dot computes the dot product; for normalized vectors, this equals cosine similarity
-        similarities = np.dot(self.predefined_embeddings, query_embedding.T).flatten()
-        
-        # Find the best matching question
-        best_idx = np.argmax(similarities)
-        best_score = similarities[best_idx]
+        similarities = self._cosine_similarities(query_embedding)
         
+        # Find the best matching question with a single fused scan:
+        # np.argmax plus the follow-up indexed read sweeps the vector
+        # twice, and for a bank this small the NumPy dispatch overhead
+        # dominates anyway. One Python loop finds (index, score) in one
+        # pass and bails out early once a score is already saturated.
+        best_idx = 0
+        best_score = -1.0
+        for i, score in enumerate(similarities.tolist()):
+            if score > best_score:
+                best_idx = i
+                best_score = score
+                if best_score >= EARLY_EXIT_SCORE:
+                    break
+
         # Only return match if it meets the threshold
         if best_score >= SIMILARITY_THRESHOLD:
-            return QUESTIONS[best_idx], float(best_score)
-        
+            return best_idx, float(best_score)
+
         return None, float(best_score)
-    
-    def _find_facet_match(self, query: str) -> Optional[str]:
+
+    def _prefilter_rejects(self, query: str) -> bool:
+        """
+        Check whether the trigram prefilter rules out a semantic match.
+
+        Intersects the query's trigram bloom with every question's bloom
+        and looks at the best overlap. Below _PREFILTER_MIN_OVERLAP bits,
+        the query shares (collisions aside) at most one trigram with the
+        closest bank question - far from anything that could clear
+        SIMILARITY_THRESHOLD - so the encoder pass can be skipped.
+
+        Args:
+            query: The user's input query
+
+        Returns:
+            True if no bank question overlaps enough to bother encoding
+        """
+        query_bloom = _trigram_bloom(query.lower())
+        overlaps = _popcount_u64(self._question_blooms & query_bloom).sum(axis=1)
+        return int(overlaps.max()) < _PREFILTER_MIN_OVERLAP
+
+    def _quantize_embeddings(self) -> None:
+        """
+        Quantize the predefined-embedding bank to symmetric int8.
+
+        Each row is L2-normalized, then scaled by its absmax / 127 and
+        rounded to int8. The per-row scales are kept so similarity scores
+        can be rescaled back to the cosine range at query time. This cuts
+        memory bandwidth for the bank 4x versus FP32 and lets the dot
+        product run on int8 values (VNNI int8 instructions where the
+        underlying kernel supports them).
+
+        Stores:
+            self._embeddings_int8: (N, dim) int8 quantized bank
+            self._embedding_scales: (N,) float32 per-row dequantization scales
+        """
+        # _compute_embeddings already L2-normalizes the bank; renormalize
+        # defensively so quantization stays correct if that ever changes.
+        # Upcast first - the bank may be a float16 mmap from the disk cache.
+        bank = np.asarray(self.predefined_embeddings, dtype=np.float32)
+        norms = np.linalg.norm(bank, axis=1, keepdims=True)
+        normalized = bank / np.maximum(norms, 1e-12)
+
+        scales = np.abs(normalized).max(axis=1) / 127.0
+        scales = np.maximum(scales, 1e-12)  # Guard all-zero rows
+
+        self._embeddings_int8 = np.round(normalized / scales[:, None]).astype(np.int8)
+        self._embedding_scales = scales.astype(np.float32)
+
+    def _int8_similarities(self, query_embedding) -> np.ndarray:
+        """
+        Score the query against the int8-quantized bank.
+
+        The query is normalized and quantized to int8 with its own scale,
+        the dot products are accumulated in int32, and the result is
+        rescaled by (query_scale * row_scale) back to cosine similarity.
+
+        Args:
+            query_embedding: Encoded query, shape (1, dim)
+
+        Returns:
+            1-D float32 array of approximate cosine similarities
+        """
+        q = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        q = q / max(float(np.linalg.norm(q)), 1e-12)
+
+        q_scale = max(float(np.abs(q).max()), 1e-12) / 127.0
+        q_int8 = np.round(q / q_scale).astype(np.int8)
+
+        # int32 accumulation avoids overflow on the int8 products
+        dots = self._embeddings_int8.astype(np.int32) @ q_int8.astype(np.int32)
+
+        return dots.astype(np.float32) * (self._embedding_scales * np.float32(q_scale))
+
+    def _cosine_similarities(self, query_embedding) -> np.ndarray:
+        """
+        Compute cosine similarities between a query and all predefined questions.
+
+        Uses SimSIMD's fused cosine kernel when available, which dispatches to
+        AVX-512/NEON instructions and fuses the dot product and norms into a
+        single pass - faster than np.dot for our small question bank, where
+        BLAS call overhead outweighs the math. Falls back to np.dot otherwise.
+
+        Args:
+            query_embedding: Encoded query, shape (1, dim)
+
+        Returns:
+            1-D array of similarity scores, one per predefined question
+        """
+        if INT8_SCORING:
+            return self._int8_similarities(query_embedding)
+
+        if SIMSIMD_AVAILABLE:
+            # cdist returns cosine *distance*; similarity = 1 - distance.
+            # Matching the query dtype to the bank lets SimSIMD use its
+            # native fp16 kernels when the bank is stored as float16.
+            distances = simsimd.cdist(
+                np.ascontiguousarray(
+                    query_embedding, dtype=self.predefined_embeddings.dtype
+                ),
+                self.predefined_embeddings,
+                metric="cosine",
+            )
+            return 1.0 - np.asarray(distances, dtype=np.float32).flatten()
+
+        # Dot products of normalized vectors are cosine similarities.
+        # Upcast so accumulation happens in FP32.
+        bank = self.predefined_embeddings.astype(np.float32)
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+
+        if bank.shape[0] < _SMALL_BANK_ROWS:
+            # For a bank this small, BLAS GEMV dispatch (and OpenBLAS's
+            # threading heuristics) costs more than the arithmetic.
+            # einsum runs a plain single-threaded C loop with no BLAS
+            # involvement, which wins at this size.
+            return np.einsum("ij,j->i", bank, query)
+
+        return bank @ query
+
+    def _init_facet_masks(self) -> None:
+        """
+        Encode each facet as a bitmask over the facet-word vocabulary.
+
+        Word-overlap matching previously built Python sets and intersected
+        them per facet. Instead, assign every distinct facet word a bit
+        index and store each facet as a row of uint64 words with those bits
+        set. At query time the overlap count for every facet is a single
+        vectorized AND + popcount over the whole matrix.
+
+        Stores:
+            self._facet_vocab: word -> bit index
+            self._facet_masks: (num_facets, num_u64_words) uint64 bitmask rows
+
+        Mask rows are aligned with FACET_KEYS/FACET_ANSWER_IDX, so a
+        winning row resolves its answer through ANSWERS_POOL.
+        """
+        vocab = {}
+        for facet in FACET_KEYS:
+            for word in facet.split():
+                vocab.setdefault(word, len(vocab))
+
+        num_words = (len(vocab) + 63) // 64 or 1
+        masks = np.zeros((len(FACET_KEYS), num_words), dtype=np.uint64)
+
+        for row, facet in enumerate(FACET_KEYS):
+            for word in facet.split():
+                bit = vocab[word]
+                masks[row, bit >> 6] |= np.uint64(1) << np.uint64(bit & 63)
+
+        self._facet_vocab = vocab
+        self._facet_masks = masks
+
+    def _find_facet_match(self, ctx: QueryCtx) -> Optional[str]:
         """
         Check if query matches any facet keywords (functional descriptions).
         
@@ -257,8 +1290,8 @@ class ThoughtfulAIAgent:
         search for functional queries.
         
         Args:
-            query: The user's input query
-            
+            ctx: Preprocessed query context
+
         Returns:
             The matching answer string, or None if no facet matches
             
@@ -266,42 +1299,86 @@ class ThoughtfulAIAgent:
             1. Check for exact substring matches in facet keywords
             2. If no exact match, check for word overlap (>= 2 words)
         """
-        query_lower = query.lower()
-        
+        query_lower = ctx.lower
+
         # Priority 1: Check for exact substring matches
-        # This catches queries like "do you process claims"
-        for facet, answer in FACET_MAP.items():
-            if facet in query_lower:
-                return answer
+        # This catches queries like "do you process claims".
+        # With pyahocorasick all facets are scanned in one linear pass;
+        # the hit with the lowest FACET_MAP position wins, matching the
+        # fallback loop's first-match behavior.
+        if self._facet_automaton is not None:
+            best_position = None
+            best_answer_idx = None
+            for _, (position, answer_idx) in self._facet_automaton.iter(query_lower):
+                if best_position is None or position < best_position:
+                    best_position = position
+                    best_answer_idx = answer_idx
+            if best_answer_idx is not None:
+                return ANSWERS_POOL[best_answer_idx]
+        else:
+            for facet, answer_idx in FACET_ENTRIES:
+                if facet in query_lower:
+                    return ANSWERS_POOL[answer_idx]
         
         # Priority 2: Check for word overlap
-        # This catches variations like "claims processing" vs "process claims"
-        query_words = set(query_lower.split())
-        best_match = None
-        best_score = 0
-        
-        for facet, answer in FACET_MAP.items():
-            facet_words = set(facet.split())
-            overlap = len(query_words & facet_words)
-            
-            # Require at least 2 words to match for better precision
-            # This prevents false matches on single common words
-            if overlap >= 2 and overlap > best_score:
-                best_score = overlap
-                best_match = answer
-        
-        return best_match
+        # This catches variations like "claims processing" vs "process claims".
+        # The query is hashed into the facet-word bitmask space and overlaps
+        # for all facets are computed in one vectorized AND + popcount.
+        query_mask = np.zeros(self._facet_masks.shape[1], dtype=np.uint64)
+        for word in ctx.tokens_set:
+            bit = self._facet_vocab.get(word)
+            if bit is not None:
+                query_mask[bit >> 6] |= np.uint64(1) << np.uint64(bit & 63)
+
+        overlaps = _popcount_u64(self._facet_masks & query_mask).sum(axis=1)
+        best_idx = int(overlaps.argmax())
+
+        # Require at least 2 words to match for better precision
+        # This prevents false matches on single common words
+        if overlaps[best_idx] >= 2:
+            return ANSWERS_POOL[FACET_ANSWER_IDX[best_idx]]
+
+        return None
     
-    def _detect_intent(self, query: str) -> str:
+    def _fast_intent_precheck(self, ctx: QueryCtx) -> Optional[str]:
+        """
+        Cheap intent classification for obviously-conversational queries.
+
+        A query of at most _PRECHECK_MAX_TOKENS tokens, all of which are
+        known intent words ("hi", "thanks", "bye", ...), cannot be a real
+        product question - so the full encoder forward pass in semantic
+        search would be wasted on it. This check costs a split and a few
+        set lookups.
+
+        Args:
+            ctx: Preprocessed query context
+
+        Returns:
+            The detected intent string if the query is trivially an intent,
+            or None if it should go through the full matching pipeline
+        """
+        tokens = ctx.tokens
+
+        if not tokens or len(tokens) > _PRECHECK_MAX_TOKENS:
+            return None
+        if any(token not in _INTENT_VOCAB for token in tokens):
+            return None
+
+        # Classify with the normal detector so categorization (and its
+        # priority order) stays identical to the full pipeline
+        intent = self._detect_intent(ctx)
+        return intent if intent != "unknown" else None
+
+    def _detect_intent(self, ctx: QueryCtx) -> str:
         """
         Detect the user's intent from their query.
         
         This method uses keyword matching to categorize user input into
         predefined intent categories. This allows the agent to provide
         context-appropriate responses.
-        
+
         Args:
-            query: The user's input query
+            ctx: Preprocessed query context
             
         Returns:
             Intent category string:
@@ -322,56 +1399,103 @@ class ThoughtfulAIAgent:
             6. Confusion
             7. Unknown (default)
         """
-        query_lower = query.lower().strip()
-        words = query_lower.split()
-        words_set = set(words)
-        
+        query_lower = ctx.lower
+
+        # Fastest path: single-token queries resolve with one dict probe
+        tokens = ctx.tokens
+        if len(tokens) == 1:
+            hit = _FIRST_WORD_INTENT.get(tokens[0])
+            if hit is not None:
+                return hit
+
+        # Fast path: single Aho-Corasick scan over the query. All keywords
+        # are matched in one linear pass; the lowest-priority hit wins,
+        # which mirrors the check order of the fallback below.
+        if self._intent_automaton is not None:
+            return self._detect_intent_automaton(query_lower)
+
+        words_set = ctx.tokens_set
+
         # Priority 1: Help/capabilities
         # Check these first since they're more specific than greetings
-        help_keywords = [
-            "help", "what can you do", "what do you do", "capabilities",
-            "what are you", "who are you", "features", "functions", "assist"
-        ]
-        for keyword in help_keywords:
+        for keyword in _HELP_SUBSTRINGS:
             if keyword in query_lower:
                 return "help"
-        
-        # Priority 2: Greetings
-        greeting_words = ["hi", "hello", "hey", "greetings", "howdy", "hiya", "yo", "sup"]
-        if any(word in words_set for word in greeting_words):
-            return "greeting"
-        
-        # Check for time-based greetings ("good morning", etc.)
-        if any(word in query_lower for word in ["morning", "afternoon", "evening"]):
+
+        # Priority 2: Greetings - one hash-set intersection, then the
+        # time-based substring forms ("good morning", etc.)
+        if words_set & _GREETING_WORDS:
             return "greeting"
-        
+        for keyword in _TIME_GREETING_SUBSTRINGS:
+            if keyword in query_lower:
+                return "greeting"
+
         # Priority 3: Farewell
-        farewell_words = ["bye", "goodbye", "cya", "later"]
-        if any(word in words_set for word in farewell_words):
+        if words_set & _FAREWELL_WORDS:
             return "farewell"
-        if "see you" in query_lower or "exit" in words_set or "quit" in words_set:
-            return "farewell"
-        
+        for keyword in _FAREWELL_SUBSTRINGS:
+            if keyword in query_lower:
+                return "farewell"
+
         # Priority 4: Gratitude
-        gratitude_words = ["thanks", "thank", "thx", "ty", "appreciate", "grateful", "cheers"]
-        if any(word in words_set for word in gratitude_words):
+        if words_set & _GRATITUDE_WORDS:
             return "gratitude"
-        
+
         # Priority 5: Acknowledgment
-        ack_words = ["ok", "okay", "cool", "great", "good", "nice", "perfect", "sure", "alright"]
-        if any(word in words_set for word in ack_words):
+        if words_set & _ACK_WORDS:
             return "acknowledgment"
-        
+
         # Priority 6: Confusion/unclear
-        confusion_words = ["what", "huh", "confused"]
-        if any(word in words_set for word in confusion_words[:2]):
+        if words_set & _CONFUSION_WORDS:
             return "confusion"
-        if "don't understand" in query_lower or "dont understand" in query_lower:
-            return "confusion"
-        
+        for keyword in _CONFUSION_SUBSTRINGS:
+            if keyword in query_lower:
+                return "confusion"
+
         # Default: Unknown intent
         return "unknown"
-    
+
+    def _detect_intent_automaton(self, query_lower: str) -> str:
+        """
+        Classify intent with a single Aho-Corasick pass over the query.
+
+        All intent keywords live in one automaton, so classification is
+        O(len(query)) regardless of how many keywords exist - versus the
+        fallback's one Python membership check per keyword list.
+
+        Args:
+            query_lower: The lowercased, stripped user query
+
+        Returns:
+            Intent category string (same categories as _detect_intent)
+        """
+        best_priority = None
+        best_intent = "unknown"
+
+        for end_idx, (priority, intent, whole_word, length) in \
+                self._intent_automaton.iter(query_lower):
+            if whole_word:
+                # Require whitespace (or string-edge) boundaries so the
+                # hit corresponds to a whole split() token, exactly like
+                # the fallback's word-set membership check. This both
+                # stops "sup" firing inside "support" and keeps parity
+                # on punctuation: "hey!" splits to the token "hey!",
+                # which the fallback does not classify either.
+                start_idx = end_idx - length + 1
+                if start_idx > 0 and not query_lower[start_idx - 1].isspace():
+                    continue
+                if end_idx + 1 < len(query_lower) and \
+                        not query_lower[end_idx + 1].isspace():
+                    continue
+
+            if best_priority is None or priority < best_priority:
+                best_priority = priority
+                best_intent = intent
+                if priority == 0:
+                    break  # Can't do better than the top-priority intent
+
+        return best_intent
+
     def _get_generic_response(self, intent: str) -> Tuple[str, str]:
         """
         Get a context-appropriate generic response.
@@ -394,26 +1518,15 @@ class ThoughtfulAIAgent:
             >>> print(source)
             'generic-greeting'
         """
-        # Map intents to their response lists and source labels
-        response_map = {
-            "greeting": (GREETING_RESPONSES, "generic-greeting"),
-            "help": (HELP_RESPONSES, "generic-help"),
-            "farewell": (FAREWELL_RESPONSES, "generic-farewell"),
-            "gratitude": (GRATITUDE_RESPONSES, "generic-gratitude"),
-            "acknowledgment": (ACKNOWLEDGMENT_RESPONSES, "generic-ack"),
-            "confusion": (CONFUSION_RESPONSES, "generic-confusion"),
-            "unknown": (UNKNOWN_RESPONSES, "generic-unknown"),
-        }
-        
-        responses, source = response_map.get(intent, response_map["unknown"])
-        
+        table_idx = _INTENT_INDEX.get(intent, Intent.UNKNOWN)
+        positions, source = _RESPONSE_TABLE[table_idx]
+
         # Cycle through responses for variety
         # This ensures users don't see the same response every time
-        counter_key = intent if intent in self._response_counters else "unknown"
-        index = self._response_counters[counter_key] % len(responses)
-        self._response_counters[counter_key] += 1
-        
-        return responses[index], source
+        index = self._response_counters[table_idx]
+        self._response_counters[table_idx] = index + 1
+
+        return RESPONSES[positions[index % len(positions)]], source
     
     def _get_openai_response(self, query: str) -> Optional[str]:
         """
@@ -464,7 +1577,62 @@ class ThoughtfulAIAgent:
             # Silently fall back to generic responses on any error
             # This ensures the agent always responds, even if OpenAI fails
             return None
-    
+
+    def _get_openai_response_budgeted(self, query: str) -> Optional[str]:
+        """
+        Run the OpenAI fallback under a latency budget.
+
+        The SDK call is pushed to a daemon worker thread (same pattern as
+        _QueryBatcher) and given OPENAI_TIMEOUT_S seconds to finish; on
+        timeout this returns None so the caller serves the generic
+        fallback immediately. The in-flight request is left to complete
+        (and be discarded) in the background - cheaper than cancellation
+        and keeps the worker warm - and because the worker is a daemon
+        thread, a call that never returns can't stall interpreter exit
+        the way a ThreadPoolExecutor's joined workers would.
+
+        Args:
+            query: The user's input query
+
+        Returns:
+            Generated response string, or None on timeout/failure
+        """
+        if OPENAI_TIMEOUT_S <= 0:
+            return self._get_openai_response(query)
+
+        if self._openai_worker is None:
+            self._openai_queue = queue.Queue()
+            self._openai_worker = threading.Thread(
+                target=self._openai_worker_loop, daemon=True,
+                name="openai-fallback",
+            )
+            self._openai_worker.start()
+
+        done = threading.Event()
+        slot = [None]
+        self._openai_queue.put((query, slot, done))
+        if done.wait(timeout=OPENAI_TIMEOUT_S):
+            return slot[0]
+        return None
+
+    def _openai_worker_loop(self) -> None:
+        """
+        Drain budgeted OpenAI requests on the daemon worker thread.
+
+        Each queue item is (query, result_slot, done_event); the answer
+        (or None) lands in the slot before the event is set, so a waiter
+        that hasn't timed out yet reads a fully written result.
+        """
+        while True:
+            query, slot, done = self._openai_queue.get()
+            try:
+                slot[0] = self._get_openai_response(query)
+            except Exception:
+                slot[0] = None
+            finally:
+                done.set()
+
+
     def respond(self, query: str) -> dict:
         """
         Generate a response to the user's query.
@@ -502,8 +1670,9 @@ class ThoughtfulAIAgent:
                 'confidence': 0.96
             }
         """
-        query = query.strip()
-        
+        ctx = QueryCtx.from_query(query)
+        query = ctx.raw
+
         # Handle empty input
         if not query:
             return {
@@ -512,12 +1681,27 @@ class ThoughtfulAIAgent:
                 "confidence": None
             }
         
+        # =========================================================================
+        # PRIORITY 0: Fast intent pre-check
+        # Short queries made up entirely of intent words ("hi", "ok thanks")
+        # are answered straight from the generic responses - no model load,
+        # no encoder forward pass
+        # =========================================================================
+        fast_intent = self._fast_intent_precheck(ctx)
+        if fast_intent:
+            response, source = self._get_generic_response(fast_intent)
+            return {
+                "response": response,
+                "source": source,
+                "confidence": None
+            }
+
         # =========================================================================
         # PRIORITY 1: Facet-based matching
         # This catches functional queries without requiring agent names
         # Example: "how do you handle claims" → CAM answer
         # =========================================================================
-        facet_answer = self._find_facet_match(query)
+        facet_answer = self._find_facet_match(ctx)
         if facet_answer:
             return {
                 "response": facet_answer,
@@ -530,11 +1714,11 @@ class ThoughtfulAIAgent:
         # Uses sentence embeddings to find similar questions
         # Example: "Tell me about CAM" → matches "What is CAM?"
         # =========================================================================
-        matched_question, score = self._find_best_match(query)
-        
-        if matched_question:
+        matched_idx, score = self._find_best_match(query)
+
+        if matched_idx is not None:
             return {
-                "response": ANSWERS[matched_question],
+                "response": ANSWERS_POOL[QUESTION_ANSWER_IDX[matched_idx]],
                 "source": "predefined",
                 "confidence": score
             }
@@ -544,14 +1728,14 @@ class ThoughtfulAIAgent:
         # Recognizes greetings, help requests, thanks, farewells, etc.
         # Example: "hi" → Greeting response
         # =========================================================================
-        intent = self._detect_intent(query)
-        
+        intent = self._detect_intent(ctx)
+
         # =========================================================================
         # PRIORITY 4: OpenAI fallback (if enabled)
         # Only for truly unknown queries, not for recognized intents
         # =========================================================================
         if intent == "unknown" and self.openai_enabled:
-            openai_response = self._get_openai_response(query)
+            openai_response = self._get_openai_response_budgeted(query)
             if openai_response:
                 return {
                     "response": openai_response,
@@ -0,0 +1,20 @@
+"""
+Shared pytest configuration for the test suite.
+
+Installs a lightweight stub for the ``openai`` package before ``agent`` is
+first imported, so each test worker skips the real SDK's import cost (it
+pulls in httpx, pydantic and friends). The agent only ever references the
+``OpenAI`` class, and the tests patch ``agent.OpenAI`` anyway, so the stub
+is all they need. Set THOUGHTFUL_REAL_OPENAI=1 to test against the real
+SDK instead.
+"""
+
+import os
+import sys
+import types
+
+if os.getenv("THOUGHTFUL_REAL_OPENAI", "0") != "1":
+    _stub = types.ModuleType("openai")
+    _stub.OpenAI = type("OpenAI", (), {"__init__": lambda self, **kwargs: None})
+    # setdefault: never clobber an already-imported real SDK
+    sys.modules.setdefault("openai", _stub)
@@ -4,6 +4,11 @@ Includes variations to handle different phrasings of the same question.
 Also includes facet-based keywords for functional queries.
 """
 
+import sys
+from array import array
+from itertools import chain
+from types import MappingProxyType
+
 PREDEFINED_QA = [
     # EVA - Eligibility Verification Agent
     {
@@ -135,42 +140,68 @@ PREDEFINED_QA = [
     }
 ]
 
-# Build flattened list of all questions (main + variations) for semantic search
-QUESTIONS = []
-ANSWER_MAP = {}  # Maps normalized question to answer
-
-# Build facet-to-answer mapping
-FACET_MAP = {}  # Maps facet keywords to answer
-
-for qa in PREDEFINED_QA:
-    main_q = qa["question"]
-    answer = qa["answer"]
-    variations = qa.get("variations", [])
-    facets = qa.get("facets", [])
-    
-    # Add main question
-    QUESTIONS.append(main_q)
-    ANSWER_MAP[main_q] = answer
-    
-    # Add variations
-    for var in variations:
-        QUESTIONS.append(var)
-        ANSWER_MAP[var] = answer
-    
-    # Add facets to facet map
-    for facet in facets:
-        FACET_MAP[facet.lower()] = answer
+# Build the flattened question list (main + variations) and its maps with
+# comprehensions: the (question, answer) pairs stream straight into
+# list/dict C constructors instead of paying a bound-method append and a
+# single-key dict insert per entry.
+#
+# All keys (and the handful of shared answer strings) are interned:
+# every map entry then points at one canonical PyUnicode object, and
+# dict probes against interned keys short-circuit on pointer identity
+# before falling back to a character compare.
+_QA_PAIRS = [
+    (sys.intern(q), sys.intern(qa["answer"]))
+    for qa in PREDEFINED_QA
+    for q in chain([qa["question"]], qa.get("variations", ()))
+]
+
+# Flattened list of all questions (main + variations) for semantic search
+QUESTIONS = [q for q, _ in _QA_PAIRS]
+
+# Maps normalized question to answer
+ANSWER_MAP = dict(_QA_PAIRS)
+
+# Maps facet keywords to answer
+FACET_MAP = {
+    sys.intern(facet.lower()): sys.intern(qa["answer"])
+    for qa in PREDEFINED_QA
+    for facet in qa.get("facets", ())
+}
 
 # For backward compatibility
 ANSWERS = ANSWER_MAP
 
 
+# ============================================================================
+# DERIVED PARALLEL-ARRAY VIEWS
+# ============================================================================
+# Index-aligned tuples over the maps above, so hot-path consumers can work
+# with integer indexes instead of re-lowercasing and re-hashing long
+# question strings per query. The answer pool dedupes the handful of
+# distinct answer strings shared by all their question/facet keys.
+
+QUESTIONS_LOWER = tuple(q.lower() for q in QUESTIONS)
+QUESTION_ANSWERS = tuple(ANSWER_MAP[q] for q in QUESTIONS)
+
+_answer_pool_index = {}
+for _answer in QUESTION_ANSWERS:
+    if _answer not in _answer_pool_index:
+        _answer_pool_index[_answer] = len(_answer_pool_index)
+ANSWERS_POOL = tuple(_answer_pool_index)
+
+# 'H' (unsigned short) keeps each index at 2 bytes; plenty for this corpus
+QUESTION_ANSWER_IDX = array('H', (_answer_pool_index[a] for a in QUESTION_ANSWERS))
+
+FACET_KEYS = tuple(FACET_MAP)
+FACET_ANSWER_IDX = array('H', (_answer_pool_index[a] for a in FACET_MAP.values()))
+
+
 # ============================================================================
 # GENERIC RESPONSE CATEGORIES
 # ============================================================================
 
 # Greeting responses - when user says hi, hello, hey, etc.
-GREETING_RESPONSES = [
+GREETING_RESPONSES = (
     "Hello! 👋 Welcome to Thoughtful AI Support. I'm here to help you with questions about our healthcare automation agents like EVA, CAM, and PHIL. What would you like to know?",
     "Hi there! Welcome to Thoughtful AI. I can tell you all about our AI agents that streamline healthcare processes. How can I assist you today?",
     "Hey! 👋 Thanks for reaching out to Thoughtful AI Support. I'm your friendly agent for questions about EVA, CAM, PHIL, and more. What can I help you with?",
@@ -179,20 +210,20 @@ GREETING_RESPONSES = [
     "Welcome to Thoughtful AI! 🎉 I'm your support agent. Ask me anything about our healthcare automation solutions!",
     "Hello! I'm your virtual assistant for Thoughtful AI. I can explain how our agents help streamline healthcare operations. What would you like to explore?",
     "Hey there! Ready to learn about Thoughtful AI's automation agents? I'm here to help with any questions about EVA, CAM, PHIL, or our other solutions!",
-]
+)
 
 # Help/Capability responses - when user asks what the agent can do
-HELP_RESPONSES = [
+HELP_RESPONSES = (
     "I can help you with questions about Thoughtful AI's healthcare automation agents!\n\nI know about:\n• EVA - Eligibility Verification Agent\n• CAM - Claims Processing Agent\n• PHIL - Payment Posting Agent\n• General info about Thoughtful AI and our benefits\n\nWhat would you like to know about?",
     "Here's what I can help you with:\n\nOur Agents:\n• EVA - Automates patient eligibility verification\n• CAM - Streamlines claims processing\n• PHIL - Automates payment posting\n\nPlus general questions about Thoughtful AI and how our solutions benefit healthcare organizations.\n\nWhat interests you?",
     "I'm your Thoughtful AI support specialist! I can answer questions about:\n\n• What each agent (EVA, CAM, PHIL) does\n• How our automation works\n• The benefits of using Thoughtful AI\n• General information about our company\n\nWhat would you like to explore?",
     "Great question! I'm designed to help with:\n\n• Understanding EVA, CAM, and PHIL\n• Learning about Thoughtful AI's solutions\n• Discovering the benefits of healthcare automation\n• General support questions\n\nTry asking 'What is EVA?' or 'Tell me about CAM!'",
     "I can assist you with information about our AI-powered healthcare agents:\n\n• EVA - Real-time eligibility verification\n• CAM - Accurate claims processing\n• PHIL - Fast payment reconciliation\n\nPlus general questions about our company and solutions. What can I tell you about?",
     "Here's my expertise area:\n\nHealthcare Automation Agents:\n• EVA (Eligibility Verification)\n• CAM (Claims Processing)\n• PHIL (Payment Posting)\n\nPlus benefits, company info, and how we help healthcare organizations.\n\nWhat would you like to dive into?",
-]
+)
 
 # Farewell/Goodbye responses - when user says bye, thanks, etc.
-FAREWELL_RESPONSES = [
+FAREWELL_RESPONSES = (
     "You're welcome! Thanks for chatting with Thoughtful AI Support. Have a great day! 👋",
     "Glad I could help! Feel free to come back if you have more questions about our agents. Take care!",
     "Thank you for reaching out! If you need more info about EVA, CAM, or PHIL later, I'm here. Goodbye! 👋",
@@ -201,10 +232,10 @@ FAREWELL_RESPONSES = [
     "Appreciate you stopping by! Reach out anytime you need help with Thoughtful AI. Take care! 👋",
     "You're welcome! Wishing you success with your healthcare automation journey. Goodbye!",
     "Glad to assist! Come back anytime for questions about EVA, CAM, PHIL, or Thoughtful AI. Have a great one!",
-]
+)
 
 # Gratitude responses - when user says thanks, thank you, etc.
-GRATITUDE_RESPONSES = [
+GRATITUDE_RESPONSES = (
     "You're very welcome! 😊 Happy to help with any questions about our agents!",
     "My pleasure! Let me know if you need anything else about Thoughtful AI.",
     "Glad I could help! Feel free to ask if you want to dive deeper into any of our agents.",
@@ -213,10 +244,10 @@ GRATITUDE_RESPONSES = [
     "Anytime! 😊 I'm here whenever you need info about our healthcare automation agents.",
     "You're most welcome! Excited to help you explore Thoughtful AI's capabilities.",
     "Glad to be of service! Reach out if you have more questions about our agents.",
-]
+)
 
 # Unknown/Out-of-scope responses - when user asks something unrelated
-UNKNOWN_RESPONSES = [
+UNKNOWN_RESPONSES = (
     "I'm not sure about that. I specialize in Thoughtful AI's healthcare automation agents like EVA, CAM, and PHIL. Is there something about those I can help you with?",
     "I don't have information on that topic. I'm specifically designed to answer questions about Thoughtful AI's agents (EVA, CAM, PHIL) and their benefits. How can I help you with those?",
     "That's outside my area of expertise. I focus on Thoughtful AI's healthcare automation solutions. Would you like to know about EVA, CAM, or PHIL instead?",
@@ -227,10 +258,10 @@ UNKNOWN_RESPONSES = [
     "Sorry, that's beyond my knowledge base. I stick to what I know best - Thoughtful AI's agents! Ask me about EVA, CAM, or PHIL?",
     "I'm focused on healthcare automation at Thoughtful AI. For that other topic, you might need a different resource. But hey, want to learn about our agents?",
     "That's a different topic than what I cover. I'm here for EVA, CAM, PHIL, and Thoughtful AI questions! What can I tell you?",
-]
+)
 
 # Acknowledgment responses - when user says ok, got it, I see, etc.
-ACKNOWLEDGMENT_RESPONSES = [
+ACKNOWLEDGMENT_RESPONSES = (
     "Great! Let me know if you have any other questions. I'm here to help!",
     "Got it! Feel free to ask if you want to learn more about any of our agents.",
     "Perfect! Is there anything else about Thoughtful AI you'd like to explore?",
@@ -239,25 +270,70 @@ ACKNOWLEDGMENT_RESPONSES = [
     "Understood! Let me know if there's anything else I can clarify about our agents.",
     "Excellent! I'm ready to help with any follow-up questions you might have.",
     "Cool! Feel free to dig deeper into any topic about Thoughtful AI.",
-]
+)
 
 # Confusion/Clarification responses - when user input is unclear
-CONFUSION_RESPONSES = [
+CONFUSION_RESPONSES = (
     "I'm not quite sure I understand. Could you rephrase that? I can help with questions about EVA, CAM, PHIL, or Thoughtful AI in general.",
     "Hmm, I didn't catch that. Try asking me about our agents like 'What is EVA?' or 'Tell me about CAM!'",
     "I want to help, but I'm not sure what you're asking. I know lots about Thoughtful AI's healthcare agents though!",
     "Could you try asking that a different way? I can answer questions about EVA, CAM, PHIL, or our company benefits.",
     "I'm a bit confused by that. But I can definitely help with: What is EVA? What does CAM do? How does PHIL work?",
     "Not sure I got that. I'm designed to help with Thoughtful AI agent questions. What would you like to know?",
-]
+)
+
+
+# ============================================================================
+# FLATTENED RESPONSE STORAGE
+# ============================================================================
+# Every generic response in one contiguous tuple, with a range per
+# category. Pickers that work by (category, index) subscript one shared
+# object array instead of chasing seven separate list objects.
+
+_RESPONSE_CATEGORIES = (
+    ("greeting", GREETING_RESPONSES),
+    ("help", HELP_RESPONSES),
+    ("farewell", FAREWELL_RESPONSES),
+    ("gratitude", GRATITUDE_RESPONSES),
+    ("unknown", UNKNOWN_RESPONSES),
+    ("acknowledgment", ACKNOWLEDGMENT_RESPONSES),
+    ("confusion", CONFUSION_RESPONSES),
+)
+
+RESPONSES = tuple(
+    response
+    for _, category_responses in _RESPONSE_CATEGORIES
+    for response in category_responses
+)
+
+CATEGORY_SLICES = {}
+_offset = 0
+for _category, _category_responses in _RESPONSE_CATEGORIES:
+    CATEGORY_SLICES[_category] = range(_offset, _offset + len(_category_responses))
+    _offset += len(_category_responses)
 
 
 # Keyword mappings for intent detection
 INTENT_KEYWORDS = {
-    "greeting": ["hi", "hello", "hey", "greetings", "howdy", "hiya", "yo", "sup", "morning", "afternoon", "evening"],
-    "help": ["help", "what can you do", "what do you do", "capabilities", "what are you", "who are you", "features", "functions", "assist"],
-    "farewell": ["bye", "goodbye", "see you", "cya", "later", "exit", "quit"],
-    "gratitude": ["thanks", "thank you", "thx", "ty", "appreciate", "grateful", "cheers"],
-    "acknowledgment": ["ok", "okay", "cool", "great", "good", "nice", "perfect", "sure", "alright"],
-    "confusion": ["what", "huh", "confused", "don't understand", "dont understand"],
+    "greeting": ("hi", "hello", "hey", "greetings", "howdy", "hiya", "yo", "sup", "morning", "afternoon", "evening"),
+    "help": ("help", "what can you do", "what do you do", "capabilities", "what are you", "who are you", "features", "functions", "assist"),
+    "farewell": ("bye", "goodbye", "see you", "cya", "later", "exit", "quit"),
+    "gratitude": ("thanks", "thank you", "thx", "ty", "appreciate", "grateful", "cheers"),
+    "acknowledgment": ("ok", "okay", "cool", "great", "good", "nice", "perfect", "sure", "alright"),
+    "confusion": ("what", "huh", "confused", "don't understand", "dont understand"),
 }
+
+
+# ============================================================================
+# FROZEN VIEWS
+# ============================================================================
+# Everything above is a build-time constant; freeze it. Tuples drop the
+# list over-allocation slack and resize checks, and MappingProxyType
+# makes accidental mutation by an importer a loud TypeError instead of a
+# silent drift between modules that share these tables.
+
+QUESTIONS = tuple(QUESTIONS)
+ANSWER_MAP = MappingProxyType(ANSWER_MAP)
+ANSWERS = ANSWER_MAP
+FACET_MAP = MappingProxyType(FACET_MAP)
+INTENT_KEYWORDS = MappingProxyType(INTENT_KEYWORDS)
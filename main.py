@@ -12,24 +12,77 @@ It includes:
 Usage:
     python main.py
 
+    The interface layer is pure Python (Rich + stdlib, no C extensions
+    of its own) and also runs under PyPy: pypy3 main.py. The heavy
+    numpy/torch dependencies load only when agent.py is imported inside
+    main().
+
 Commands:
     /help      - Show welcome message
     /examples  - Show example questions
     /quit      - Exit with conversation summary
 """
 
+import io
+import os
 import sys
 import time
-from rich.console import Console
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
-from rich.prompt import Prompt
 from rich import box
 from rich.align import Align
-from rich.rule import Rule
+from rich.style import Style
+
+# Optional: line editing and input history for the prompt. Importing
+# readline upgrades plain input() in place; absent (e.g. on Windows
+# without pyreadline3) the prompt still works, just without editing.
+try:
+    import readline  # noqa: F401
+    READLINE_AVAILABLE = True
+except ImportError:
+    READLINE_AVAILABLE = False
+
+# Skip the cosmetic animations when stdout is not an interactive
+# terminal (piped/scripted/CI usage) or when THOUGHTFUL_FAST=1. The
+# startup, typing and exit sequences sleep for ~2.5s per session in
+# total - pure wall-clock cost with no compute behind it.
+FAST = not sys.stdout.isatty() or os.environ.get("THOUGHTFUL_FAST") == "1"
+
+# Pre-composed ANSI prompt ("You: " in bold green). Prompt.ask would
+# re-parse markup and run a full Rich render on every loop iteration
+# just to emit these few characters; a raw write does the same job.
+# With readline active, the escape codes are wrapped in \x01/\x02 so
+# the line editor excludes them from its prompt-width bookkeeping.
+if READLINE_AVAILABLE:
+    _PROMPT = "\x01\x1b[1;32m\x02You\x01\x1b[0m\x02: "
+else:
+    _PROMPT = "\x1b[1;32mYou\x1b[0m: "
 
-# Import the core agent
-from agent import ThoughtfulAIAgent
+# Startup logo as markup lines plus its cell width (emoji take two
+# cells). Padding is prepended as plain spaces at print time, which
+# skips the measure-and-center pass Align.center would run per render.
+_LOGO_LINES = (
+    "[dim blue]╭─────────────────────────────╮[/]",
+    "[dim blue]│                             │[/]",
+    "[bold cyan]│   💙  Thoughtful AI  💙    │[/]",
+    "[dim blue]│                             │[/]",
+    "[dim]│   Customer Support Agent    │[/]",
+    "[dim blue]│                             │[/]",
+    "[dim blue]╰─────────────────────────────╯[/]",
+)
+_LOGO_WIDTH = 31
+
+# Command words, matched against the stripped lowercase input exactly
+# once per turn (frozenset membership instead of repeated list scans)
+_EXIT_COMMANDS = frozenset({"/quit", "/exit", "quit", "exit"})
+_HELP_COMMANDS = frozenset({"/help", "help"})
+_EXAMPLES_COMMANDS = frozenset({"/examples", "/example", "examples"})
+
+# Width of the answer preview kept in conversation history
+_PREVIEW_LEN = 50
 
 
 def create_startup_animation(console: Console) -> None:
@@ -52,19 +105,13 @@ def create_startup_animation(console: Console) -> None:
     console.clear()
     
     # Animation 1: Brand logo
-    # Using a simple box with hearts for visual appeal
-    logo_text = Text()
-    logo_text.append("╭─────────────────────────────╮\n", style="dim blue")
-    logo_text.append("│                             │\n", style="dim blue")
-    logo_text.append("│   💙  Thoughtful AI  💙    │\n", style="bold cyan")
-    logo_text.append("│                             │\n", style="dim blue")
-    logo_text.append("│   Customer Support Agent    │\n", style="dim")
-    logo_text.append("│                             │\n", style="dim blue")
-    logo_text.append("╰─────────────────────────────╯", style="dim blue")
-    
-    console.print(Align.center(logo_text))
-    console.print()
-    
+    # Pre-padded against the current terminal width - one markup parse,
+    # no Align.center measurement - and rendered together with its
+    # spacer line in a single grouped print.
+    pad = " " * max((console.width - _LOGO_WIDTH) // 2, 0)
+    logo_text = Text.from_markup("\n".join(pad + line for line in _LOGO_LINES))
+    console.print(Group(logo_text, Text()))
+
     # Animation 2: Loading indicator
     # Using Rich's built-in status spinner
     with console.status("[cyan]Initializing...[/cyan]", spinner="dots"):
@@ -78,19 +125,27 @@ def create_startup_animation(console: Console) -> None:
         ("[dim]→ Initializing semantic search...[/dim]", 0.4),
     ]
     
-    for message, delay in steps:
-        console.print(Align.center(message))
+    # Sleep through the progress beats, then emit all three lines (and
+    # the trailing spacer) in a single render instead of four separate
+    # layout + ANSI passes.
+    for _message, delay in steps:
         time.sleep(delay)
-    
-    console.print()
+
+    console.print(Group(
+        *(Align.center(message) for message, _delay in steps),
+        Text(),
+    ))
 
 
-def create_welcome_panel() -> Panel:
+def _build_welcome_panel() -> Panel:
     """
-    Create the welcome panel with instructions.
-    
-    This panel is shown at startup and when the user types /help.
-    It provides:
+    Build the welcome panel with instructions.
+
+    Called once at import to populate WELCOME_PANEL - the content is
+    fully static, so every /help and the startup banner reuse the same
+    renderable instead of re-running a dozen Text.append calls.
+
+    The panel provides:
     - Welcome message with emoji
     - List of topics the agent can help with
     - Available commands
@@ -98,28 +153,26 @@ def create_welcome_panel() -> Panel:
     Returns:
         Rich Panel with styled welcome content
     """
-    welcome_text = Text()
-    welcome_text.append("👋 ", style="bold yellow")
-    welcome_text.append("Welcome to Thoughtful AI Support!\n\n", style="bold cyan")
-    welcome_text.append("I can help you with questions about:\n", style="white")
-    welcome_text.append("  • EVA (Eligibility Verification Agent)\n", style="green")
-    welcome_text.append("  • CAM (Claims Processing Agent)\n", style="green")
-    welcome_text.append("  • PHIL (Payment Posting Agent)\n", style="green")
-    welcome_text.append("  • General questions about Thoughtful AI\n\n", style="green")
-    welcome_text.append("Commands:\n", style="bold")
-    welcome_text.append("  • Type your question and press Enter\n", style="dim")
-    welcome_text.append("  • Type ", style="dim")
-    welcome_text.append("/quit", style="bold red")
-    welcome_text.append(" or ", style="dim")
-    welcome_text.append("/exit", style="bold red")
-    welcome_text.append(" to exit\n", style="dim")
-    welcome_text.append("  • Type ", style="dim")
-    welcome_text.append("/help", style="bold yellow")
-    welcome_text.append(" to see this message again\n", style="dim")
-    welcome_text.append("  • Type ", style="dim")
-    welcome_text.append("/examples", style="bold magenta")
-    welcome_text.append(" to see example questions", style="dim")
-    
+    # One markup parse instead of twenty Text.append calls - each append
+    # extends the internal spans list in pure Python, while from_markup
+    # builds the same spans in a single pass.
+    welcome_text = Text.from_markup(
+        "[bold yellow]👋 [/][bold cyan]Welcome to Thoughtful AI Support!\n\n[/]"
+        "[white]I can help you with questions about:\n[/]"
+        "[green]  • EVA (Eligibility Verification Agent)\n"
+        "  • CAM (Claims Processing Agent)\n"
+        "  • PHIL (Payment Posting Agent)\n"
+        "  • General questions about Thoughtful AI\n\n[/]"
+        "[bold]Commands:\n[/]"
+        "[dim]  • Type your question and press Enter\n[/]"
+        "[dim]  • Type [/][bold red]/quit[/][dim] or [/][bold red]/exit[/]"
+        "[dim] to exit\n[/]"
+        "[dim]  • Type [/][bold yellow]/help[/]"
+        "[dim] to see this message again\n[/]"
+        "[dim]  • Type [/][bold magenta]/examples[/]"
+        "[dim] to see example questions[/]"
+    )
+
     return Panel(
         Align.center(welcome_text),
         title="[bold blue]Thoughtful AI Agent[/bold blue]",
@@ -129,12 +182,12 @@ def create_welcome_panel() -> Panel:
     )
 
 
-def create_examples_panel() -> Panel:
+def _build_examples_panel() -> Panel:
     """
-    Create a panel showing example questions.
-    
-    This panel is shown when the user types /examples.
-    It provides concrete examples of questions the agent can answer,
+    Build the panel showing example questions.
+
+    Called once at import to populate EXAMPLES_PANEL - shown whenever
+    the user types /examples. It provides concrete examples of questions the agent can answer,
     color-coded by topic for visual distinction.
     
     Returns:
@@ -151,13 +204,14 @@ def create_examples_panel() -> Panel:
         ("❓", "What can you do?", "bright_black"),   # Help
     ]
     
-    text = Text()
-    text.append("Try asking me:\n\n", style="bold")
-    
-    for emoji, question, color in examples:
-        text.append(f"{emoji} ", style=color)
-        text.append(f"{question}\n", style=color)
-    
+    # Single markup parse for the whole list (see _build_welcome_panel)
+    text = Text.from_markup(
+        "[bold]Try asking me:\n\n[/]" + "".join(
+            f"[{color}]{emoji} {question}\n[/]"
+            for emoji, question, color in examples
+        )
+    )
+
     return Panel(
         text,
         title="[bold magenta]Example Questions[/bold magenta]",
@@ -167,6 +221,21 @@ def create_examples_panel() -> Panel:
     )
 
 
+# Static renderables built once at import; Rich renderables are
+# immutable for our purposes, so reprinting the same object is safe.
+WELCOME_PANEL = _build_welcome_panel()
+EXAMPLES_PANEL = _build_examples_panel()
+
+
+# Both status-bar variants parsed at import; openai_enabled is fixed at
+# agent init, so startup just picks one
+_STATUS_BASIC = Text.from_markup("[green]🟢 [/][dim green]Online[/]")
+_STATUS_ENHANCED = Text.from_markup(
+    "[green]🟢 [/][dim green]Online[/]"
+    "[dim]  •  [/][magenta]🤖 [/][dim magenta]Enhanced[/]"
+)
+
+
 def create_status_bar(agent) -> Text:
     """
     Create a status bar showing agent configuration.
@@ -181,17 +250,55 @@ def create_status_bar(agent) -> Text:
     Returns:
         Rich Text object with status indicators
     """
-    status = Text()
-    status.append("🟢 ", style="green")
-    status.append("Online", style="dim green")
-    
-    # Show enhanced mode if OpenAI is available
-    if agent.openai_enabled:
-        status.append("  •  ", style="dim")
-        status.append("🤖 ", style="magenta")
-        status.append("Enhanced", style="dim magenta")
-    
-    return status
+    # Enhanced mode shows when OpenAI is available
+    return _STATUS_ENHANCED if agent.openai_enabled else _STATUS_BASIC
+
+
+# Emoji per generic-response intent, hoisted out of format_agent_message
+# so the dict is not rebuilt on every reply
+_EMOJI_MAP = {
+    "greeting": "👋",
+    "help": "❓",
+    "farewell": "👋",
+    "gratitude": "🙏",
+    "ack": "✓",
+    "confusion": "🤔",
+    "unknown": "💬",
+}
+
+# Pre-built footers for every source whose text is fixed. The
+# "predefined" footer stays dynamic (it carries a per-reply confidence
+# score); everything else is fully determined by the source string.
+_FOOTERS = {
+    "llm": Text.from_markup("[bold magenta]🤖 [/][dim magenta]AI enhanced[/]"),
+}
+for _intent, _emoji in _EMOJI_MAP.items():
+    _FOOTERS[f"generic-{_intent}"] = Text.from_markup(
+        f"[bold blue]{_emoji} [/][dim blue]{_intent.capitalize()} response[/]"
+    )
+
+# Fallback footer for error or otherwise unexpected sources
+_SYSTEM_FOOTER = Text.from_markup("[bold yellow]⚠ [/][dim yellow]System message[/]")
+
+# Predefined footer without a confidence score, assembled once
+_PREDEFINED_FOOTER = Text.assemble(
+    ("✓ ", "bold green"), ("Predefined answer", "dim green")
+)
+
+# Bubble titles parsed once; passing a markup string to Panel(title=...)
+# would re-parse it on every message
+_USER_TITLE = Text.from_markup("[bold green]You[/bold green]")
+_AGENT_TITLE = Text.from_markup("[bold cyan]Thoughtful AI Agent[/bold cyan]")
+
+# Border and content styles parsed once for the per-message panels;
+# passing Style objects skips the style-string parse inside Panel
+_USER_BORDER = Style.parse("green")
+_AGENT_BORDER = Style.parse("cyan")
+_CONTENT_STYLE = Style.parse("white")
+
+# Confidence bands for the predefined footer, highest threshold first:
+# green (high), yellow (medium), red (low)
+_CONF_STYLES = (("green", 0.9), ("yellow", 0.7), ("red", 0.0))
 
 
 def format_user_message(message: str) -> Panel:
@@ -208,14 +315,51 @@ def format_user_message(message: str) -> Panel:
         Rich Panel with styled user message
     """
     return Panel(
-        Text(message, style="white"),
-        title="[bold green]You[/bold green]",
-        border_style="green",
+        Text(message, style=_CONTENT_STYLE),
+        title=_USER_TITLE,
+        border_style=_USER_BORDER,
         box=box.ROUNDED,
         width=80
     )
 
 
+# Raw-ANSI fast path for the user bubble. The ANSI codes (32 = green,
+# 1;32 = bold green, 37 = white) and box glyphs mirror the Rich panel
+# above closely enough that the two variants are indistinguishable for
+# plain one-line input.
+_USER_BOX_WIDTH = 80
+_USER_BOX_INNER = _USER_BOX_WIDTH - 4
+
+
+def _format_user_message_fast(message: str) -> str:
+    """
+    Render the user chat bubble as a raw ANSI string.
+
+    format_user_message runs Rich's full measure/layout/segment
+    pipeline for what is a fixed green box around one line of text -
+    the hottest render in the loop. This builds the same box with
+    f-strings and precomputed escape codes. Only used for short,
+    single-line, printable ASCII input; anything that needs wrapping or
+    width-aware layout falls back to the Rich panel.
+
+    Args:
+        message: The user's input message (pre-validated by the caller)
+
+    Returns:
+        ANSI string for the bubble, without a trailing newline
+    """
+    side = _USER_BOX_WIDTH - 2 - 5  # borders plus " You " in the top rule
+    left = side // 2
+    right = side - left
+    return (
+        f"\x1b[32m╭{'─' * left}\x1b[0m \x1b[1;32mYou\x1b[0m "
+        f"\x1b[32m{'─' * right}╮\x1b[0m\n"
+        f"\x1b[32m│\x1b[0m \x1b[37m{message.ljust(_USER_BOX_INNER)}\x1b[0m "
+        f"\x1b[32m│\x1b[0m\n"
+        f"\x1b[32m╰{'─' * (_USER_BOX_WIDTH - 2)}╯\x1b[0m"
+    )
+
+
 def format_agent_message(response: dict) -> Panel:
     """
     Format agent response as a chat bubble with source indicator.
@@ -234,81 +378,59 @@ def format_agent_message(response: dict) -> Panel:
     content_text = response["response"]
     
     # Use plain text for reliable formatting (Markdown can have wrapping issues)
-    content = Text(content_text, style="white")
+    content = Text(content_text, style=_CONTENT_STYLE)
     
     # Build source indicator subtitle
-    footer_text = Text()
     source = response["source"]
-    
+
     if source == "predefined":
-        # Predefined answer from dataset
-        footer_text.append("✓ ", style="bold green")
-        footer_text.append(f"Predefined answer", style="dim green")
-        
-        # Add color-coded confidence score
+        # Predefined answer from dataset - built per reply because it
+        # carries the confidence score. Text.assemble builds the span
+        # list in one pass instead of one append call per fragment.
         if response.get("confidence"):
             confidence = response["confidence"]
-            # Color code: green (high), yellow (medium), red (low)
-            if confidence >= 0.9:
-                conf_style = "green"
-            elif confidence >= 0.7:
-                conf_style = "yellow"
-            else:
-                conf_style = "red"
-            footer_text.append(f" (confidence: ", style="dim")
-            footer_text.append(f"{confidence:.2f}", style=conf_style)
-            footer_text.append(")", style="dim")
-    
-    elif source == "llm":
-        # OpenAI-generated response
-        footer_text.append("🤖 ", style="bold magenta")
-        footer_text.append("AI enhanced", style="dim magenta")
-    
-    elif source.startswith("generic-"):
-        # Generic intent-based response
-        intent = source.replace("generic-", "")
-        emoji_map = {
-            "greeting": "👋",
-            "help": "❓",
-            "farewell": "👋",
-            "gratitude": "🙏",
-            "ack": "✓",
-            "confusion": "🤔",
-            "unknown": "💬",
-        }
-        emoji = emoji_map.get(intent, "💬")
-        footer_text.append(f"{emoji} ", style="bold blue")
-        footer_text.append(f"{intent.capitalize()} response", style="dim blue")
-    
+            conf_style = next(
+                style for style, threshold in _CONF_STYLES
+                if confidence >= threshold
+            )
+            footer_text = Text.assemble(
+                ("✓ ", "bold green"),
+                ("Predefined answer", "dim green"),
+                (" (confidence: ", "dim"),
+                (f"{confidence:.2f}", conf_style),
+                (")", "dim"),
+            )
+        else:
+            footer_text = _PREDEFINED_FOOTER
+
     else:
-        # Error or other unexpected source
-        footer_text.append("⚠ ", style="bold yellow")
-        footer_text.append("System message", style="dim yellow")
-    
+        # Fixed-text sources (llm, generic-*) come straight from the
+        # precomputed table; anything unrecognized gets the system footer
+        footer_text = _FOOTERS.get(source)
+        if footer_text is None:
+            if source.startswith("generic-"):
+                # Generic source with an intent not in the table -
+                # built on the fly with the default emoji
+                intent = source.partition("-")[2]
+                footer_text = Text.from_markup(
+                    f"[bold blue]{_EMOJI_MAP.get(intent, '💬')} [/]"
+                    f"[dim blue]{intent.capitalize()} response[/]"
+                )
+            else:
+                # Error or other unexpected source
+                footer_text = _SYSTEM_FOOTER
+
+
     return Panel(
         content,
-        title="[bold cyan]Thoughtful AI Agent[/bold cyan]",
+        title=_AGENT_TITLE,
         subtitle=footer_text,
-        border_style="cyan",
+        border_style=_AGENT_BORDER,
         box=box.ROUNDED,
         width=80
     )
 
 
-def show_typing_indicator(console: Console) -> None:
-    """
-    Show a brief typing indicator animation.
-    
-    This creates the illusion that the agent is "thinking" before responding,
-    making the interaction feel more natural and conversational.
-    
-    Args:
-        console: Rich Console instance for output
-    """
-    with console.status("[bold cyan]🤔 Thinking...[/bold cyan]", spinner="dots2"):
-        time.sleep(0.4)  # Brief pause for effect
-
-
 def show_exit_animation(console: Console) -> None:
     """
     Show a subtle exit animation.
@@ -319,6 +441,10 @@ def show_exit_animation(console: Console) -> None:
         console: Rich Console instance for output
     """
     console.print()
+
+    if FAST:
+        return
+
     with console.status("[dim]Closing session...[/dim]", spinner="moon"):
         time.sleep(0.5)
 
@@ -337,19 +463,51 @@ def main():
     
     The loop continues until the user types /quit or presses Ctrl+C.
     """
-    console = Console()
-    
+    # Block-buffer stdout (64 KB) so each Rich render reaches the
+    # terminal as a handful of write syscalls instead of one per
+    # fragment; the Console flushes after every print, so output still
+    # appears per render. Skipped when stdout has been replaced by
+    # something without a raw buffer (pipes wrapped by test harnesses).
+    try:
+        sys.stdout = io.TextIOWrapper(
+            sys.stdout.buffer,
+            encoding=sys.stdout.encoding,
+            line_buffering=False,
+            write_through=False,
+        )
+    except AttributeError:
+        pass
+
+    # Single console for the whole session, threaded through every
+    # helper. highlight=False skips the automatic highlighter's regex
+    # pass over each printed string - all styling here is explicit
+    # markup or pre-styled Text, so the highlighter only costs time.
+    console = Console(highlight=False)
+    
+    # Import the core agent here rather than at module top: pulling in
+    # agent.py drags numpy and sentence-transformers along, so importing
+    # main for anything other than running the loop (tooling, future
+    # --help/--version paths) stays cheap.
+    from agent import ThoughtfulAIAgent
+
+    # Kick off agent construction in the background so it overlaps the
+    # startup animation: the ~1.7s of animation sleeps and the agent's
+    # own init cost run concurrently instead of back to back.
+    init_executor = ThreadPoolExecutor(max_workers=1)
+    agent_future = init_executor.submit(ThoughtfulAIAgent)
+
     # Show startup animation for professional first impression
-    create_startup_animation(console)
-    
-    # Display welcome panel with instructions
-    console.print(create_welcome_panel())
-    console.print()
-    
-    # Initialize the agent
-    # This loads the embedding model and pre-computes question embeddings
+    # (skipped entirely in FAST mode - it is pure sleep and spinner)
+    if not FAST:
+        create_startup_animation(console)
+
+    # Display welcome panel with instructions (panel + spacer in one render)
+    console.print(Group(WELCOME_PANEL, Text()))
+
+    # Collect the agent built in the background (waits only for
+    # whatever init work the animation didn't already cover)
     try:
-        agent = ThoughtfulAIAgent()
+        agent = agent_future.result()
     except Exception as e:
         console.print(Panel(
             f"[bold red]Error initializing agent:[/bold red] {str(e)}\n"
@@ -359,34 +517,56 @@ def main():
             border_style="red"
         ))
         sys.exit(1)
-    
-    # Show status bar (Online + Enhanced if OpenAI enabled)
-    console.print(Align.center(create_status_bar(agent)))
-    console.print()
-    
-    # Track conversation history for summary on exit
-    conversation_history = []
+    finally:
+        init_executor.shutdown(wait=False)
+
+    # Show status bar (Online + Enhanced if OpenAI enabled). Built once:
+    # it depends only on openai_enabled, which is fixed at init, so any
+    # future redraw (e.g. after /help) can reprint the same renderable.
+    status_bar = Group(Align.center(create_status_bar(agent)), Text())
+    console.print(status_bar)
+
+    # Track conversation history for summary on exit. Only the last 5
+    # exchanges (Q + A pairs) are ever shown, so a bounded deque keeps
+    # session memory O(1) instead of growing a list forever.
+    conversation_history = deque(maxlen=10)
     
     # =========================================================================
     # MAIN CONVERSATION LOOP
     # =========================================================================
     while True:
         try:
-            # Get user input with styled prompt
-            user_input = Prompt.ask("[bold green]You[/bold green]")
+            # Get user input with the pre-composed prompt; input() has
+            # zero Rich involvement and, with readline imported, gives
+            # history and line editing for free
+            try:
+                user_input = input(_PROMPT)
+            except EOFError:
+                # Ctrl+D or closed stdin ends the session cleanly
+                user_input = "/quit"
             
             # -----------------------------------------------------------------
             # COMMAND HANDLING
             # -----------------------------------------------------------------
-            
+
+            # Normalize once per turn; every command check below reuses it
+            cmd = user_input.strip().lower()
+
             # Exit commands
-            if user_input.lower() in ['/quit', '/exit', 'quit', 'exit']:
+            if cmd in _EXIT_COMMANDS:
                 # Show conversation summary if there was a conversation
                 if conversation_history:
-                    console.print()
-                    console.print(Rule("[dim]Conversation Summary[/dim]", style="dim"))
-                    for item in conversation_history[-5:]:  # Last 5 exchanges
-                        console.print(f"[dim]• {item[:60]}...[/dim]")
+                    # Rule is only needed for this one exit-time render,
+                    # so its import is deferred off the startup path
+                    from rich.rule import Rule
+
+                    # Batch the rule and every summary line into one render
+                    console.print(Group(
+                        Text(),
+                        Rule("[dim]Conversation Summary[/dim]", style="dim"),
+                        *(f"[dim]• {item[:60]}...[/dim]"
+                          for item in conversation_history)  # Already just the tail
+                    ))
                 
                 # Show exit animation and goodbye message
                 console.print()
@@ -398,41 +578,57 @@ def main():
                 break
             
             # Help command
-            if user_input.lower() in ['/help', 'help']:
-                console.print(create_welcome_panel())
-                console.print()
+            if cmd in _HELP_COMMANDS:
+                console.print(Group(WELCOME_PANEL, Text()))
                 continue
-            
+
             # Examples command
-            if user_input.lower() in ['/examples', '/example', 'examples']:
-                console.print(create_examples_panel())
-                console.print()
+            if cmd in _EXAMPLES_COMMANDS:
+                console.print(Group(EXAMPLES_PANEL, Text()))
                 continue
-            
+
             # Skip empty input
-            if not user_input.strip():
+            if not cmd:
                 continue
             
             # -----------------------------------------------------------------
             # PROCESS USER MESSAGE
             # -----------------------------------------------------------------
             
-            # Display user message in a chat bubble
-            console.print(format_user_message(user_input))
-            
-            # Show typing indicator for natural feel
-            show_typing_indicator(console)
-            
-            # Get agent response
-            response = agent.respond(user_input)
+            # Display user message in a chat bubble. Short one-line
+            # ASCII input takes the raw-ANSI fast path, bypassing the
+            # Rich pipeline; anything needing wrapping or wide-char
+            # layout keeps the full panel.
+            if (len(user_input) <= _USER_BOX_INNER
+                    and user_input.isascii() and user_input.isprintable()):
+                sys.stdout.write(_format_user_message_fast(user_input) + "\n")
+                sys.stdout.flush()
+            else:
+                console.print(format_user_message(user_input))
+
+            # Compute the response with the thinking spinner running
+            # while the real work happens, instead of sleeping after
+            # the answer is already in hand. Fast predefined hits
+            # barely flash the spinner; slow paths (first model load,
+            # OpenAI fallback) show live feedback for exactly as long
+            # as they actually take.
+            if FAST:
+                response = agent.respond(user_input)
+            else:
+                with console.status("[bold cyan]🤔 Thinking...[/bold cyan]",
+                                    spinner="dots2"):
+                    response = agent.respond(user_input)
             
-            # Track in conversation history
-            conversation_history.append(f"Q: {user_input}")
-            conversation_history.append(f"A: {response['response'][:50]}...")
+            # Track in conversation history, truncating at append time
+            # so a pasted wall of text can't pin kilobytes in the deque
+            conversation_history.append(f"Q: {user_input[:120]}")
+            answer = response['response']
+            preview = answer if len(answer) <= _PREVIEW_LEN \
+                else answer[:_PREVIEW_LEN - 1] + "…"
+            conversation_history.append(f"A: {preview}")
             
-            # Display agent response
-            console.print(format_agent_message(response))
-            console.print()
+            # Display agent response (bubble + spacer in one render)
+            console.print(Group(format_agent_message(response), Text()))
             
         except KeyboardInterrupt:
             # Handle Ctrl+C gracefully